@@ -15,31 +15,207 @@ Usage:
 """
 
 import configparser
+import io
 import os
+import sys
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Parsed INI files keyed by absolute path, tagged with the (st_mtime_ns, st_size)
+# they were parsed at so an edited file is re-read on next use. Entries are
+# immutable tuples replaced by a single assignment and their parsers are only
+# ever cloned, so lookups and stores need no lock.
+_parse_cache: Dict[str, Tuple[int, int, configparser.ConfigParser]] = {}
+
+# Files modified this recently are not cached: filesystem timestamps are coarse, so a
+# same-size rewrite within one tick could otherwise keep an unchanged mtime
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Lower-cased strings get_bool() treats as true
+_TRUTHY = frozenset({"true", "yes", "1", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Interpret a config string as a boolean; anything not in _TRUTHY is False."""
+    # Skip the lower() copy for values already in lower case, the usual spelling
+    return (value if value.islower() else value.lower()) in _TRUTHY
+
+
+@lru_cache(maxsize=256)
+def _env_key(section: str, key: str) -> str:
+    """Name of the environment variable overriding section/key, e.g. TALKSMITH_MODELS_BATCH_SIZE."""
+    return f"TALKSMITH_{section.upper()}_{key.upper()}"
+
+
+def _clone_parser(source: configparser.ConfigParser) -> configparser.ConfigParser:
+    """
+    Copy a parsed ConfigParser.
+
+    Copies the raw option dicts directly, which is several times cheaper than
+    both copy.deepcopy and re-parsing, and skips re-validating values that
+    were already accepted when the file was read.
+    """
+    clone = configparser.ConfigParser()
+    clone._defaults.update(source._defaults)
+    for section, options in source._sections.items():
+        clone.add_section(section)
+        clone._sections[section].update(options)
+    return clone
+
+
+def _render_ini(parser: configparser.ConfigParser) -> str:
+    """
+    Render a parser as INI text, byte-for-byte what parser.write() produces.
+
+    Builds the whole document in one list and joins it, rather than issuing
+    a write per line; the interpolation before_write hook is skipped since
+    BasicInterpolation returns values unchanged.
+    """
+    delimiter = f" {parser._delimiters[0]} "
+    sections = [(parser.default_section, parser._defaults)] if parser._defaults else []
+    sections.extend(parser._sections.items())
+
+    parts = []
+    for section, options in sections:
+        parts.append(f"[{section}]\n")
+        for key, value in options.items():
+            if value is None and parser._allow_no_value:
+                parts.append(f"{key}\n")
+            else:
+                value = str(value).replace("\n", "\n\t")
+                parts.append(f"{key}{delimiter}{value}\n")
+        parts.append("\n")
+    return "".join(parts)
+
+
+def _read_config_file(config_path: str) -> configparser.ConfigParser:
+    """
+    Parse an INI file, reusing the cached parse while the file is unchanged.
+
+    Args:
+        config_path: Path to an existing INI file
+
+    Returns:
+        A ConfigParser the caller is free to modify
+    """
+    abs_path = os.path.abspath(config_path)
+    try:
+        stat = os.stat(abs_path)
+    except OSError:
+        # Vanished since it was found; ConfigParser.read() would skip it too
+        return configparser.ConfigParser()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _parse_cache.get(abs_path)
+    if cached is not None and cached[:2] == signature:
+        return _clone_parser(cached[2])
+
+    read_started_ns = time.time_ns()
+    parser = configparser.ConfigParser()
+    parser.read(abs_path)
+
+    if stat.st_mtime_ns < read_started_ns - _RACY_MTIME_WINDOW_NS:
+        _parse_cache[abs_path] = (*signature, _clone_parser(parser))
+    return parser
+
+
+# Built-in default configuration values, by section
+_DEFAULTS_DICT: Dict[str, Dict[str, str]] = {
+    "Paths": {
+        "input_dir": "data/inputs",
+        "output_dir": "data/outputs",
+        "samples_dir": "data/samples",
+        "cache_dir": ".cache",
+    },
+    "Models": {
+        "whisper_model": "large-v3",
+        "whisper_device": "auto",
+        "compute_type": "float16",
+        "diarization_model": "pyannote/speaker-diarization-3.1",
+        "batch_size": "16",
+        "num_workers": "4",
+    },
+    "Diarization": {
+        "mode": "whisperx",
+        "vad_threshold": "0.5",
+        "min_speakers": "1",
+        "max_speakers": "10",
+        "min_segment_length": "0.5",
+    },
+    "Export": {
+        "formats": "txt,json,srt",
+        "include_timestamps": "true",
+        "include_confidence": "true",
+        "word_level": "false",
+    },
+    "Processing": {
+        "denoise": "false",
+        "normalize_audio": "true",
+        "trim_silence": "false",
+        "sample_rate": "16000",
+    },
+    "Logging": {
+        "level": "INFO",
+        "format": "json",
+        "log_dir": "data/outputs/{slug}/logs",
+        "console_output": "true",
+    },
+}
+
+
+def _populate_defaults(parser: configparser.ConfigParser):
+    """Fill a parser with the built-in default configuration values."""
+    parser.read_dict(_DEFAULTS_DICT)
+
+
+# Built-in defaults, populated once at import and cloned for each config without a file
+_DEFAULT_PARSER = configparser.ConfigParser()
+_populate_defaults(_DEFAULT_PARSER)
 
 
 class TalkSmithConfig:
     """Configuration manager with env var override support."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    # Bumped by set() so to_dict() knows when its cached snapshot is stale
+    _mutations: int = 0
+    # (parser, _mutations) the snapshot was built from, and the snapshot itself
+    _dict_cache: Optional[Tuple[configparser.ConfigParser, int, Dict[str, Dict[str, str]]]] = None
+    # Set inside batched_saves(); save() then only records where to write on exit
+    _saves_deferred: bool = False
+    _pending_save_path: Optional[str] = None
+    # get_path() results keyed by (raw value, working directory)
+    _path_cache: Optional[Dict[Tuple[str, str], Path]] = None
+
+    def __init__(self, config_path: Optional[str] = None, search_cwd: Optional[Path] = None):
         """
         Initialize configuration.
 
         Args:
             config_path: Path to settings.ini file. If None, looks in standard locations.
+            search_cwd: Directory searched in place of the current working directory
+                when looking for settings.ini. Defaults to Path.cwd().
         """
-        self.parser = configparser.ConfigParser()
-        self.config_path = self._find_config_file(config_path)
+        self.config_path = self._find_config_file(config_path, search_cwd)
 
         if self.config_path and os.path.exists(self.config_path):
-            self.parser.read(self.config_path)
+            self.parser = _read_config_file(self.config_path)
         else:
             # Load defaults if no config file found
             self._load_defaults()
 
-    def _find_config_file(self, config_path: Optional[str] = None) -> str:
+    def __copy__(self) -> "TalkSmithConfig":
+        """Return an independent copy; changes to either instance don't affect the other."""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.parser = _clone_parser(self.parser)
+        return clone
+
+    def _find_config_file(
+        self, config_path: Optional[str] = None, search_cwd: Optional[Path] = None
+    ) -> str:
         """
         Find configuration file in standard locations.
 
@@ -57,9 +233,10 @@ class TalkSmithConfig:
             return os.environ["TALKSMITH_CONFIG"]
 
         # Check standard locations
+        cwd = Path(search_cwd) if search_cwd is not None else Path.cwd()
         candidates = [
-            Path.cwd() / "settings.ini",
-            Path.cwd() / "config" / "settings.ini",
+            cwd / "settings.ini",
+            cwd / "config" / "settings.ini",
             Path.home() / ".talksmith" / "settings.ini",
         ]
 
@@ -68,54 +245,11 @@ class TalkSmithConfig:
                 return str(candidate)
 
         # Default to config/settings.ini even if doesn't exist
-        return str(Path.cwd() / "config" / "settings.ini")
+        return str(cwd / "config" / "settings.ini")
 
     def _load_defaults(self):
         """Load default configuration values."""
-        self.parser["Paths"] = {
-            "input_dir": "data/inputs",
-            "output_dir": "data/outputs",
-            "samples_dir": "data/samples",
-            "cache_dir": ".cache",
-        }
-
-        self.parser["Models"] = {
-            "whisper_model": "large-v3",
-            "whisper_device": "auto",
-            "compute_type": "float16",
-            "diarization_model": "pyannote/speaker-diarization-3.1",
-            "batch_size": "16",
-            "num_workers": "4",
-        }
-
-        self.parser["Diarization"] = {
-            "mode": "whisperx",
-            "vad_threshold": "0.5",
-            "min_speakers": "1",
-            "max_speakers": "10",
-            "min_segment_length": "0.5",
-        }
-
-        self.parser["Export"] = {
-            "formats": "txt,json,srt",
-            "include_timestamps": "true",
-            "include_confidence": "true",
-            "word_level": "false",
-        }
-
-        self.parser["Processing"] = {
-            "denoise": "false",
-            "normalize_audio": "true",
-            "trim_silence": "false",
-            "sample_rate": "16000",
-        }
-
-        self.parser["Logging"] = {
-            "level": "INFO",
-            "format": "json",
-            "log_dir": "data/outputs/{slug}/logs",
-            "console_output": "true",
-        }
+        self.parser = _clone_parser(_DEFAULT_PARSER)
 
     def get(self, section: str, key: str, fallback: Any = None) -> str:
         """
@@ -132,47 +266,44 @@ class TalkSmithConfig:
         Returns:
             Configuration value as string
         """
-        # Check environment variable first
-        env_key = f"TALKSMITH_{section.upper()}_{key.upper()}"
-        if env_key in os.environ:
-            return os.environ[env_key]
+        # Check environment variable first; one lookup instead of a membership test plus a read
+        env_value = os.environ.get(_env_key(section, key))
+        if env_value is not None:
+            return env_value
 
         # Fall back to config file
         return self.parser.get(section, key, fallback=fallback)
 
-    def get_int(self, section: str, key: str, fallback: int = 0) -> int:
-        """Get configuration value as integer."""
+    def _get_typed(
+        self, section: str, key: str, convert: Callable[[str], Any], fallback: Any
+    ) -> Any:
+        """Get a value passed through convert, or fallback if unset or not convertible."""
         value = self.get(section, key)
         if value is None:
             return fallback
         try:
-            return int(value)
+            return convert(value)
         except ValueError:
             return fallback
 
+    def get_int(self, section: str, key: str, fallback: int = 0) -> int:
+        """Get configuration value as integer."""
+        return self._get_typed(section, key, int, fallback)
+
     def get_float(self, section: str, key: str, fallback: float = 0.0) -> float:
         """Get configuration value as float."""
-        value = self.get(section, key)
-        if value is None:
-            return fallback
-        try:
-            return float(value)
-        except ValueError:
-            return fallback
+        return self._get_typed(section, key, float, fallback)
 
     def get_bool(self, section: str, key: str, fallback: bool = False) -> bool:
         """Get configuration value as boolean."""
-        value = self.get(section, key)
-        if value is None:
-            return fallback
-        return value.lower() in ("true", "yes", "1", "on")
+        return self._get_typed(section, key, _parse_bool, fallback)
 
     def get_list(self, section: str, key: str, separator: str = ",", fallback: list = None) -> list:
         """Get configuration value as list."""
         value = self.get(section, key)
         if value is None:
             return fallback or []
-        return [item.strip() for item in value.split(separator) if item.strip()]
+        return [stripped for item in value.split(separator) if (stripped := item.strip())]
 
     def get_path(self, section: str, key: str, create: bool = False, fallback: str = None) -> Path:
         """
@@ -191,11 +322,21 @@ class TalkSmithConfig:
         if value is None:
             return None
 
-        path = Path(value).expanduser()
+        # Relative values resolve against the working directory, so it is part of the key
+        cache_key = (value, os.getcwd())
+        if self._path_cache is None:
+            self._path_cache = {}
+        path = self._path_cache.get(cache_key)
+        if path is None:
+            path = Path(value).expanduser()
+
+            # Make absolute if relative
+            if not path.is_absolute():
+                path = Path(cache_key[1]) / path
 
-        # Make absolute if relative
-        if not path.is_absolute():
-            path = Path.cwd() / path
+            # ~ expands from HOME, which can change between calls
+            if not value.startswith("~"):
+                self._path_cache[cache_key] = path
 
         if create and not path.exists():
             path.mkdir(parents=True, exist_ok=True)
@@ -215,6 +356,21 @@ class TalkSmithConfig:
             self.parser.add_section(section)
 
         self.parser.set(section, key, str(value))
+        self._mutations += 1
+
+    def set_many(self, values: Dict[str, Dict[str, Any]]):
+        """
+        Set many configuration values at once.
+
+        Equivalent to calling set() for every key, but loads the whole
+        mapping through a single ConfigParser.read_dict() call.
+
+        Args:
+            values: Mapping of section name to {key: value}; values other
+                than None are converted with str() like set() does
+        """
+        self.parser.read_dict(values)
+        self._mutations += 1
 
     def save(self, path: Optional[str] = None):
         """
@@ -225,15 +381,102 @@ class TalkSmithConfig:
         """
         save_path = path or self.config_path
 
+        if self._saves_deferred:
+            self._pending_save_path = save_path
+            return
+
         # Create directory if needed
         Path(save_path).parent.mkdir(parents=True, exist_ok=True)
 
         with open(save_path, "w") as f:
-            self.parser.write(f)
+            f.write(_render_ini(self.parser))
+
+    @contextmanager
+    def batched_saves(self) -> Iterator["TalkSmithConfig"]:
+        """
+        Coalesce save() calls made inside the block into one write on exit.
+
+        Only the last save() is performed, to the path it was given. Nothing
+        is written if the block raises. Nested blocks defer to the outermost.
+
+        Example:
+            with config.batched_saves():
+                for key, value in updates.items():
+                    config.set("Models", key, value)
+                    config.save()
+        """
+        if self._saves_deferred:
+            yield self
+            return
+
+        self._saves_deferred = True
+        try:
+            yield self
+        finally:
+            self._saves_deferred = False
+            pending_path, self._pending_save_path = self._pending_save_path, None
+
+        if pending_path is not None:
+            self.save(pending_path)
+
+    def dumps(self) -> str:
+        """
+        Serialize configuration to INI text, as save() would write it.
+
+        Returns:
+            INI-formatted string
+        """
+        return _render_ini(self.parser)
+
+    @classmethod
+    def loads(cls, text: str, config_path: Optional[str] = None) -> "TalkSmithConfig":
+        """
+        Create configuration from INI text, e.g. the output of dumps().
+
+        Args:
+            text: INI-formatted string
+            config_path: Optional path to associate with the config for save()
+
+        Returns:
+            TalkSmithConfig instance
+        """
+        return cls.from_stream(io.StringIO(text), config_path=config_path)
+
+    @classmethod
+    def from_stream(cls, stream: IO[str], config_path: Optional[str] = None) -> "TalkSmithConfig":
+        """
+        Create configuration from an open INI text stream.
+
+        Unlike the constructor, no config file is searched for; only the
+        stream's contents are loaded.
+
+        Args:
+            stream: Readable text stream, e.g. an open file or io.StringIO
+            config_path: Optional path to associate with the config for save()
+                and to name the source in parse errors
+
+        Returns:
+            TalkSmithConfig instance
+        """
+        config = object.__new__(cls)
+        config.config_path = config_path
+        config.parser = configparser.ConfigParser()
+        config.parser.read_file(stream, source=config_path)
+        return config
 
     def to_dict(self) -> dict:
-        """Convert configuration to dictionary."""
-        return {section: dict(self.parser[section]) for section in self.parser.sections()}
+        """
+        Convert configuration to dictionary.
+
+        The interpolated values are built once and reused until set() is called
+        or the parser is replaced; changes made through self.parser directly are
+        not tracked. Each call returns fresh dicts the caller may modify.
+        """
+        cache = self._dict_cache
+        if cache is None or cache[0] is not self.parser or cache[1] != self._mutations:
+            snapshot = {section: dict(self.parser[section]) for section in self.parser.sections()}
+            self._dict_cache = cache = (self.parser, self._mutations, snapshot)
+        return {section: dict(options) for section, options in cache[2].items()}
 
 
 # Global config instance
@@ -271,11 +514,19 @@ def create_default_config(path: str = "config/settings.ini"):
     print(f"Created default configuration at: {path}")
 
 
-if __name__ == "__main__":
-    # CLI for creating default config
-    import sys
+def main(argv: Optional[List[str]] = None):
+    """
+    Command-line interface for creating a default config file.
 
-    if len(sys.argv) > 1:
-        create_default_config(sys.argv[1])
+    Args:
+        argv: Arguments after the program name; defaults to sys.argv[1:]
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if args:
+        create_default_config(args[0])
     else:
         create_default_config()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,56 @@
 """Export transcription segments to various formats (TXT, SRT, VTT, JSON)."""
 
-import json
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
 
 if TYPE_CHECKING:
     from pipeline.logger import TalkSmithLogger
 
+# Write buffer for streamed JSON exports (segments with word timings can be large)
+JSON_WRITE_BUFFER_SIZE = 64 * 1024
 
-def format_timestamp_srt(seconds: float) -> str:
-    """Format timestamp for SRT format (HH:MM:SS,mmm)."""
+# Zero-padded ASCII digits for assembling subtitle timestamps without formatting
+_TWO_DIGITS = [f"{i:02d}".encode("ascii") for i in range(100)]
+_THREE_DIGITS = [f"{i:03d}".encode("ascii") for i in range(1000)]
+
+# Timing lines contain only digits and punctuation, so the WebVTT form converts
+# to the SRT form by swapping the millisecond separator
+_VTT_TO_SRT_TIMING = bytes.maketrans(b".", b",")
+
+
+def _format_timestamp(seconds: float, millis_separator: str) -> str:
+    """Format HH:MM:SS<sep>mmm, emitting the separator directly."""
     hours = int(seconds // 3600)
     minutes = int((seconds % 3600) // 60)
     secs = int(seconds % 60)
     millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{millis_separator}{millis:03d}"
+
+
+def format_timestamp_srt(seconds: float) -> str:
+    """Format timestamp for SRT format (HH:MM:SS,mmm)."""
+    return _format_timestamp(seconds, ",")
 
 
 def format_timestamp_vtt(seconds: float) -> str:
     """Format timestamp for WebVTT format (HH:MM:SS.mmm)."""
+    return _format_timestamp(seconds, ".")
+
+
+def _append_timestamp(buf: bytearray, seconds: float, millis_separator: bytes) -> None:
+    """Append an HH:MM:SS<sep>mmm timestamp to buf using the ASCII digit tables."""
     hours = int(seconds // 3600)
     minutes = int((seconds % 3600) // 60)
     secs = int(seconds % 60)
     millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    buf += _TWO_DIGITS[hours] if hours < 100 else b"%02d" % hours
+    buf += b":"
+    buf += _TWO_DIGITS[minutes]
+    buf += b":"
+    buf += _TWO_DIGITS[secs]
+    buf += millis_separator
+    buf += _THREE_DIGITS[millis]
 
 
 def validate_segments(segments: List[Dict[str, Any]]) -> None:
@@ -46,6 +73,102 @@ def validate_segments(segments: List[Dict[str, Any]]) -> None:
             raise ValueError(f"Segment {i} has start time after end time")
 
 
+# Line separator written by every exporter, matching text-mode newline translation
+_LINE_SEPARATOR = os.linesep.encode("ascii")
+
+# Placeholder for an optional field the segment doesn't have; None is a real value
+_MISSING: Any = object()
+
+
+class _SegmentColumns(NamedTuple):
+    """Segment fields split into parallel lists, one entry per segment.
+
+    Optional fields (speaker, words) absent from a segment are stored as _MISSING,
+    so an explicit None is still exported.
+    """
+
+    starts: List[float]
+    ends: List[float]
+    texts: List[str]
+    speakers: List[Any]
+    words: List[Any]
+
+
+def _to_columns(segments: List[Dict[str, Any]], include_words: bool = False) -> _SegmentColumns:
+    """Convert validated segments to columns in a single pass.
+
+    Word timings are only collected when include_words is set; otherwise the
+    words column is all _MISSING and the (potentially large) lists are never touched.
+    """
+    columns = _SegmentColumns([], [], [], [], [])
+    for segment in segments:
+        columns.starts.append(segment["start"])
+        columns.ends.append(segment["end"])
+        columns.texts.append(segment["text"])
+        columns.speakers.append(segment.get("speaker", _MISSING))
+        if include_words:
+            columns.words.append(segment.get("words", _MISSING))
+    if not include_words:
+        columns.words.extend([_MISSING] * len(segments))
+    return columns
+
+
+def _cue_timings(columns: _SegmentColumns, millis_separator: bytes) -> List[bytes]:
+    """Build the "start --> end" timing line for every segment."""
+    timings = [b""] * len(columns.starts)
+    for i, (start, end) in enumerate(zip(columns.starts, columns.ends)):
+        buf = bytearray()
+        _append_timestamp(buf, start, millis_separator)
+        buf += b" --> "
+        _append_timestamp(buf, end, millis_separator)
+        timings[i] = bytes(buf)
+    return timings
+
+
+def _speaker_prefixes(speakers: List[Any], include_speakers: bool, suffix: str) -> List[str]:
+    """Return the label written before each segment's text.
+
+    Each string label is built once per speaker and shared; other values, which
+    may be unhashable, are formatted per segment. Transcripts without any
+    speaker labels skip the per-segment lookup and get all-empty prefixes.
+    """
+    # Allocated at full size up front; unlabelled segments keep the "" default
+    prefixes = [""] * len(speakers)
+    if not include_speakers or all(speaker is _MISSING for speaker in speakers):
+        return prefixes
+    cache: Dict[str, str] = {}
+    for i, speaker in enumerate(speakers):
+        if speaker is _MISSING:
+            continue
+        if type(speaker) is not str:
+            prefixes[i] = f"{speaker}{suffix}"
+            continue
+        prefix = cache.get(speaker)
+        if prefix is None:
+            prefix = cache[speaker] = f"{speaker}{suffix}"
+        prefixes[i] = prefix
+    return prefixes
+
+
+def _write_bytes_fast(path: Path, data: bytes) -> None:
+    """Write an already-encoded payload with raw OS calls, truncating any existing file.
+
+    Payloads are built with "\n"; it is written as the platform line separator,
+    the same translation the text-mode JSON writer gets, so every format shares
+    one newline policy.
+    """
+    if _LINE_SEPARATOR != b"\n":
+        data = data.replace(b"\n", _LINE_SEPARATOR)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def export_txt(
     segments: List[Dict[str, Any]],
     output_path: Path,
@@ -57,25 +180,38 @@ def export_txt(
     validate_segments(segments)
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    _export_txt(_to_columns(segments), output_path, include_timestamps, include_speakers, logger)
+
 
+def _export_txt(
+    columns: _SegmentColumns,
+    output_path: Path,
+    include_timestamps: bool = True,
+    include_speakers: bool = True,
+    logger: Optional["TalkSmithLogger"] = None,
+    timings: Optional[List[bytes]] = None,
+) -> None:
+    """Write TXT output from pre-split segment columns into an existing directory."""
     if logger:
         logger.debug(
             f"Exporting to TXT: {output_path}",
             format="txt",
-            segment_count=len(segments),
+            segment_count=len(columns.texts),
         )
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for segment in segments:
-            line_parts = []
-            if include_timestamps:
-                start_ts = format_timestamp_vtt(segment["start"])
-                end_ts = format_timestamp_vtt(segment["end"])
-                line_parts.append(f"[{start_ts} --> {end_ts}]")
-            if include_speakers and "speaker" in segment:
-                line_parts.append(f"{segment['speaker']}:")
-            line_parts.append(segment["text"])
-            f.write(" ".join(line_parts) + "\n")
+    prefixes = _speaker_prefixes(columns.speakers, include_speakers, ": ")
+    if include_timestamps:
+        if timings is None:
+            timings = _cue_timings(columns, b".")
+        buf = bytearray()
+        for timing, text, prefix in zip(timings, columns.texts, prefixes):
+            buf += b"["
+            buf += timing
+            buf += f"] {prefix}{text}\n".encode("utf-8")
+        _write_bytes_fast(output_path, buf)
+    else:
+        lines = [f"{prefix}{text}\n" for text, prefix in zip(columns.texts, prefixes)]
+        _write_bytes_fast(output_path, "".join(lines).encode("utf-8"))
 
     if logger:
         logger.debug(
@@ -95,26 +231,33 @@ def export_srt(
     validate_segments(segments)
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    _export_srt(_to_columns(segments), output_path, include_speakers, logger)
+
 
+def _export_srt(
+    columns: _SegmentColumns,
+    output_path: Path,
+    include_speakers: bool = True,
+    logger: Optional["TalkSmithLogger"] = None,
+    timings: Optional[List[bytes]] = None,
+) -> None:
+    """Write SRT output from pre-split segment columns into an existing directory."""
     if logger:
         logger.debug(
             f"Exporting to SRT: {output_path}",
             format="srt",
-            segment_count=len(segments),
+            segment_count=len(columns.texts),
         )
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for i, segment in enumerate(segments, start=1):
-            f.write(f"{i}\n")
-            start_ts = format_timestamp_srt(segment["start"])
-            end_ts = format_timestamp_srt(segment["end"])
-            f.write(f"{start_ts} --> {end_ts}\n")
-            text = (
-                f"{segment['speaker']}: {segment['text']}"
-                if include_speakers and "speaker" in segment
-                else segment["text"]
-            )
-            f.write(f"{text}\n\n")
+    prefixes = _speaker_prefixes(columns.speakers, include_speakers, ": ")
+    if timings is None:
+        timings = _cue_timings(columns, b",")
+    buf = bytearray()
+    for i, (timing, text, prefix) in enumerate(zip(timings, columns.texts, prefixes), start=1):
+        buf += b"%d\n" % i
+        buf += timing
+        buf += f"\n{prefix}{text}\n\n".encode("utf-8")
+    _write_bytes_fast(output_path, buf)
 
     if logger:
         logger.debug(
@@ -134,23 +277,33 @@ def export_vtt(
     validate_segments(segments)
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    _export_vtt(_to_columns(segments), output_path, include_speakers, logger)
+
 
+def _export_vtt(
+    columns: _SegmentColumns,
+    output_path: Path,
+    include_speakers: bool = True,
+    logger: Optional["TalkSmithLogger"] = None,
+    timings: Optional[List[bytes]] = None,
+) -> None:
+    """Write VTT output from pre-split segment columns into an existing directory."""
     if logger:
         logger.debug(
             f"Exporting to VTT: {output_path}",
             format="vtt",
-            segment_count=len(segments),
+            segment_count=len(columns.texts),
         )
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("WEBVTT\n\n")
-        for segment in segments:
-            if include_speakers and "speaker" in segment:
-                f.write(f"{segment['speaker']}\n")
-            start_ts = format_timestamp_vtt(segment["start"])
-            end_ts = format_timestamp_vtt(segment["end"])
-            f.write(f"{start_ts} --> {end_ts}\n")
-            f.write(f"{segment['text']}\n\n")
+    speaker_lines = _speaker_prefixes(columns.speakers, include_speakers, "\n")
+    if timings is None:
+        timings = _cue_timings(columns, b".")
+    buf = bytearray(b"WEBVTT\n\n")
+    for timing, text, speaker_line in zip(timings, columns.texts, speaker_lines):
+        buf += speaker_line.encode("utf-8")
+        buf += timing
+        buf += f"\n{text}\n\n".encode("utf-8")
+    _write_bytes_fast(output_path, buf)
 
     if logger:
         logger.debug(
@@ -171,28 +324,50 @@ def export_json(
     validate_segments(segments)
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    _export_json(_to_columns(segments, include_words), output_path, pretty, include_words, logger)
 
+
+def _export_json(
+    columns: _SegmentColumns,
+    output_path: Path,
+    pretty: bool = True,
+    include_words: bool = True,
+    logger: Optional["TalkSmithLogger"] = None,
+) -> None:
+    """Write JSON output from pre-split segment columns into an existing directory."""
     if logger:
         logger.debug(
             f"Exporting to JSON: {output_path}",
             format="json",
-            segment_count=len(segments),
+            segment_count=len(columns.texts),
         )
 
-    export_data = {"segments": []}
-    for segment in segments:
-        segment_data = {
-            "start": segment["start"],
-            "end": segment["end"],
-            "text": segment["text"],
-        }
-        if "speaker" in segment:
-            segment_data["speaker"] = segment["speaker"]
-        if include_words and "words" in segment:
-            segment_data["words"] = segment["words"]
-        export_data["segments"].append(segment_data)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(export_data, f, indent=2 if pretty else None, ensure_ascii=False)
+    import json
+
+    # Stream one segment at a time so the full payload is never held in memory;
+    # the bytes written match json.dump of {"segments": [...]} exactly.
+    if pretty:
+        opening, separator, closing = '{\n  "segments": [\n    ', ",\n    ", "\n  ]\n}"
+    else:
+        opening, separator, closing = '{"segments": [', ", ", "]}"
+    with open(output_path, "w", encoding="utf-8", buffering=JSON_WRITE_BUFFER_SIZE) as f:
+        if not columns.texts:
+            f.write('{\n  "segments": []\n}' if pretty else '{"segments": []}')
+        else:
+            f.write(opening)
+            for i, (start, end, text, speaker, words) in enumerate(zip(*columns)):
+                segment_data = {"start": start, "end": end, "text": text}
+                if speaker is not _MISSING:
+                    segment_data["speaker"] = speaker
+                if include_words and words is not _MISSING:
+                    segment_data["words"] = words
+                encoded = json.dumps(segment_data, indent=2 if pretty else None, ensure_ascii=False)
+                if pretty:
+                    encoded = encoded.replace("\n", "\n    ")
+                if i:
+                    f.write(separator)
+                f.write(encoded)
+            f.write(closing)
 
     if logger:
         logger.debug(
@@ -219,19 +394,53 @@ def export_all(
         logger.info(f"Exporting to {len(formats)} formats", formats=formats, base_name=base_name)
 
     format_handlers = {
-        "txt": (export_txt, ".txt"),
-        "srt": (export_srt, ".srt"),
-        "vtt": (export_vtt, ".vtt"),
-        "json": (export_json, ".json"),
+        "txt": (_export_txt, ".txt"),
+        "srt": (_export_srt, ".srt"),
+        "vtt": (_export_vtt, ".vtt"),
+        "json": (_export_json, ".json"),
     }
-    output_files = {}
     for fmt in formats:
         if fmt not in format_handlers:
             raise ValueError(f"Unknown format: {fmt}")
-        handler, extension = format_handlers[fmt]
-        output_path = output_dir / f"{base_name}{extension}"
-        handler(segments, output_path, logger=logger)
-        output_files[fmt] = output_path
+    output_files = {fmt: output_dir / f"{base_name}{format_handlers[fmt][1]}" for fmt in formats}
+
+    # Validate and split the segments once; every format reads the same columns
+    validate_segments(segments)
+    columns = _to_columns(segments, include_words="json" in output_files)
+
+    # TXT and VTT share the same timing lines and SRT differs only in the
+    # millisecond separator, so timestamps are formatted once for all three
+    handler_kwargs: Dict[str, Dict[str, Any]] = {fmt: {} for fmt in output_files}
+    if output_files.keys() & {"txt", "srt", "vtt"}:
+        timings = _cue_timings(columns, b".")
+        for fmt in ("txt", "vtt"):
+            if fmt in handler_kwargs:
+                handler_kwargs[fmt]["timings"] = timings
+        if "srt" in handler_kwargs:
+            handler_kwargs["srt"]["timings"] = [
+                timing.translate(_VTT_TO_SRT_TIMING) for timing in timings
+            ]
+
+    # Each format writes its own file, so the writers can overlap their I/O
+    if len(output_files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(output_files)) as executor:
+            futures = [
+                executor.submit(
+                    format_handlers[fmt][0],
+                    columns,
+                    output_path,
+                    logger=logger,
+                    **handler_kwargs[fmt],
+                )
+                for fmt, output_path in output_files.items()
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for fmt, output_path in output_files.items():
+            format_handlers[fmt][0](columns, output_path, logger=logger, **handler_kwargs[fmt])
 
     if logger:
         logger.info(
@@ -240,3 +449,45 @@ def export_all(
         )
 
     return output_files
+
+
+def export_batch(
+    jobs: List[Tuple[List[Dict[str, Any]], Path, str]],
+    formats: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    logger: Optional["TalkSmithLogger"] = None,
+) -> List[Dict[str, Path]]:
+    """Export many transcripts at once, one export_all call per job.
+
+    Each job is a (segments, output_dir, base_name) tuple. Jobs are independent,
+    so they are spread across worker processes (default: one per CPU). Results
+    are returned in job order; the first failing job's exception is re-raised.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    if logger:
+        logger.info(
+            f"Batch exporting {len(jobs)} transcripts", job_count=len(jobs), workers=workers
+        )
+
+    if workers == 1:
+        results = [
+            export_all(segments, output_dir, base_name, formats=formats, logger=logger)
+            for segments, output_dir, base_name in jobs
+        ]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(export_all, segments, output_dir, base_name, formats)
+                for segments, output_dir, base_name in jobs
+            ]
+            results = [future.result() for future in futures]
+
+    if logger:
+        logger.info(f"Batch export complete: {len(results)} transcripts", job_count=len(results))
+
+    return results
@@ -15,13 +15,16 @@ import logging
 import sys
 import time
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from config.settings import get_config
 
+# Size of the write buffer used by BufferedFileHandler for per-slug log files
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -81,6 +84,80 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
+class BufferedFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that buffers writes instead of flushing every record.
+
+    Records below ``flush_level`` accumulate in a 64 KiB buffer and reach disk
+    when it fills, on an explicit flush(), or when the handler is closed.
+    Records at ``flush_level`` or above (ERROR by default) are flushed
+    immediately so failures are never lost in the buffer.
+    """
+
+    def __init__(
+        self,
+        filename,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        delay: bool = False,
+        buffer_size: int = LOG_FILE_BUFFER_SIZE,
+        flush_level: int = logging.ERROR,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(
+            filename,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding="utf-8",
+            delay=delay,
+        )
+
+    def _open(self):
+        """Open the log file with a large write buffer and note its current size."""
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._bytes_written = stream.tell()
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        Decide on rollover from a running size count.
+
+        RotatingFileHandler seeks to the end of the stream to measure it,
+        which flushes the write buffer on every record. Sizes are counted in
+        characters, as the base class does.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            message = self.format(record) + self.terminator
+            return self._bytes_written + len(message) >= self.maxBytes
+        return False
+
+    def emit(self, record: logging.LogRecord):
+        """Write a record, flushing only for records at or above flush_level."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            message = self.format(record) + self.terminator
+            self.stream.write(message)
+            self._bytes_written += len(message)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class TalkSmithLogger:
     """
     Logger for TalkSmith with structured JSON output.
@@ -141,7 +218,7 @@ class TalkSmithLogger:
             log_dir = self._get_log_dir()
             log_file = log_dir / f"{self.slug}.log"
 
-            file_handler = RotatingFileHandler(
+            file_handler = BufferedFileHandler(
                 log_file, maxBytes=10 * 1024 * 1024, backupCount=5, delay=True  # 10MB
             )
             file_handler.setFormatter(formatter)
@@ -226,6 +303,7 @@ class TalkSmithLogger:
             extra["duration_seconds"] = duration
         extra.update(kwargs)
         self.info(f"Completed {operation}", **extra)
+        self.flush()
 
     def log_error_exit(self, message: str, exit_code: int = 1, **kwargs):
         """
@@ -242,6 +320,11 @@ class TalkSmithLogger:
         self.error(message, exit_code=exit_code, **kwargs)
         return exit_code
 
+    def flush(self):
+        """Flush buffered file output to disk."""
+        if self._file_handler:
+            self._file_handler.flush()
+
     def close(self):
         """Close file handlers to release file locks (important for Windows)."""
         if self._file_handler:
@@ -250,6 +333,7 @@ class TalkSmithLogger:
             self._file_handler = None
 
 
+@lru_cache(maxsize=128)
 def get_logger(
     name: str,
     slug: Optional[str] = None,
@@ -259,6 +343,10 @@ def get_logger(
     """
     Get or create a TalkSmith logger instance.
 
+    Instances are cached per argument combination, so repeated calls with the
+    same name and slug return the same logger without re-reading config. Call
+    ``get_logger.cache_clear()`` to force new instances (e.g. after config changes).
+
     Args:
         name: Logger name
         slug: Optional slug for file-specific logging
@@ -280,6 +368,10 @@ def get_logger(
 class BatchLogSummary:
     """
     Track and summarize results from batch operations.
+
+    Failures are logged at ERROR as they are recorded. Successes are buffered
+    in memory and emitted together by print_summary() (or flush()) instead of
+    as one log line per item.
     """
 
     def __init__(self, logger: TalkSmithLogger):
@@ -294,12 +386,13 @@ class BatchLogSummary:
         self.successful = 0
         self.failed = 0
         self.errors: list = []
+        self._pending: list = []
 
     def record_success(self, item: str):
         """Record successful processing of an item."""
         self.total += 1
         self.successful += 1
-        self.logger.debug(f"Success: {item}", item=item, status="success")
+        self._pending.append({"item": item, "status": "success"})
 
     def record_failure(self, item: str, error: str):
         """Record failed processing of an item."""
@@ -317,8 +410,14 @@ class BatchLogSummary:
         """
         return 1 if self.failed > 0 else 0
 
+    def flush(self):
+        """Log success records buffered since the last flush or summary, if any."""
+        if self._pending:
+            self.logger.info(f"Succeeded: {len(self._pending)} items", records=self._pending)
+            self._pending = []
+
     def print_summary(self):
-        """Print summary of batch operation."""
+        """Print summary of batch operation, with success records buffered since the last call."""
         summary = {
             "total": self.total,
             "successful": self.successful,
@@ -328,7 +427,12 @@ class BatchLogSummary:
             ),
         }
 
-        self.logger.info(f"Batch complete: {self.successful}/{self.total} successful", **summary)
+        self.logger.info(
+            f"Batch complete: {self.successful}/{self.total} successful",
+            records=self._pending,
+            **summary,
+        )
+        self._pending = []
 
         if self.errors:
             self.logger.error(f"Failed items: {len(self.errors)}", errors=self.errors)
@@ -240,6 +240,8 @@ class LoadBalancer:
             for error in self.batch_summary.errors:
                 print(f"  - {error['item']}: {error['error']}")
 
+        self.batch_summary.print_summary()
+
     def get_exit_code(self) -> int:
         """
         Get exit code based on batch summary.
@@ -260,7 +262,7 @@ class LoadBalancer:
         return self.completed_count
 
     def reset(self) -> None:
-        """Reset all statistics and counters."""
+        """Reset all statistics and counters, logging any buffered results first."""
         self.completed_count = 0
         self.total_duration = 0.0
         self.total_processing_time = 0.0
@@ -270,4 +272,5 @@ class LoadBalancer:
         }
         self.results = []
         self.errors = []
+        self.batch_summary.flush()
         self.batch_summary = BatchLogSummary(self.logger)
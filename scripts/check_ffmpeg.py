@@ -4,35 +4,44 @@ FFmpeg Verification Script for TalkSmith
 Verifies FFmpeg installation and functionality.
 """
 
+import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Tuple
 
+# A codec row of `ffmpeg -codecs`: capability flags (e.g. "DEA.L.") then the codec name
+_CODEC_RE = re.compile(r"^\s*[A-Z.]{3,6}\s+(pcm_s16le|aac)\b", re.IGNORECASE | re.MULTILINE)
 
+
+@lru_cache(maxsize=1)
 def check_ffmpeg_installed() -> bool:
-    """Check if FFmpeg is installed and accessible in PATH."""
+    """Check if FFmpeg is installed and accessible in PATH (PATH is searched once)."""
     return shutil.which("ffmpeg") is not None
 
 
+@lru_cache(maxsize=1)
 def get_ffmpeg_version() -> Optional[str]:
     """Get FFmpeg version string."""
     try:
         result = subprocess.run(
             ["ffmpeg", "-version"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=5,
         )
         if result.returncode == 0:
-            # Extract version from first line
-            first_line = result.stdout.split("\n")[0]
-            return first_line
+            # Extract version from first line without splitting the rest
+            return result.stdout.partition("\n")[0].rstrip()
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
     return None
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg_codecs() -> Tuple[bool, bool]:
     """Check for essential audio codecs."""
     try:
@@ -42,24 +51,35 @@ def check_ffmpeg_codecs() -> Tuple[bool, bool]:
             text=True,
             timeout=5,
         )
-        output = result.stdout.lower()
-        has_pcm = "pcm_s16le" in output
-        has_aac = "aac" in output
-        return has_pcm, has_aac
+        found = {match.group(1).lower() for match in _CODEC_RE.finditer(result.stdout)}
+        return "pcm_s16le" in found, "aac" in found
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False, False
 
 
+@lru_cache(maxsize=1)
 def check_ffprobe_installed() -> bool:
-    """Check if ffprobe is installed and accessible in PATH."""
+    """Check if ffprobe is installed and accessible in PATH (PATH is searched once)."""
     return shutil.which("ffprobe") is not None
 
 
+def _probe_ffmpeg() -> Tuple[Optional[str], Tuple[bool, bool]]:
+    """
+    Run the version and codec probes in parallel, as two separate ffmpeg processes.
+
+    A single combined ``ffmpeg -version -codecs`` invocation was not adopted; the
+    two probes stay independent so each keeps its own parsing, caching and tests.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        version = executor.submit(get_ffmpeg_version)
+        codecs = executor.submit(check_ffmpeg_codecs)
+        return version.result(), codecs.result()
+
+
 def print_section(title: str, char: str = "="):
     """Print a section header."""
-    print(f"\n{char * 70}")
-    print(f"  {title}")
-    print(f"{char * 70}\n")
+    rule = char * 70
+    print(f"\n{rule}\n  {title}\n{rule}\n")
 
 
 def print_status(label: str, value: any, success: bool = True):
@@ -87,7 +107,7 @@ def main():
         print("\n  ⚠ FFmpeg is not installed or not in PATH")
         print("  ⚠ Please install FFmpeg - see docs/prereqs.md for instructions")
     else:
-        version = get_ffmpeg_version()
+        version, (has_pcm, has_aac) = _probe_ffmpeg()
         if version:
             print_status("Version", version[:60], True)  # Truncate long version string
 
@@ -105,8 +125,6 @@ def main():
     # Check codecs
     if ffmpeg_installed:
         print_section("Audio Codec Support", "-")
-        has_pcm, has_aac = check_ffmpeg_codecs()
-
         print_status("PCM (WAV)", "Supported" if has_pcm else "NOT FOUND", has_pcm)
         print_status("AAC", "Supported" if has_aac else "NOT FOUND", has_aac)
 
@@ -7,6 +7,7 @@ Confirms GPU visibility to PyTorch.
 
 import platform
 import sys
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
@@ -81,8 +82,9 @@ def check_cuda_availability() -> Dict[str, any]:
         }
 
 
+@lru_cache(maxsize=1)
 def check_nvidia_driver() -> Optional[str]:
-    """Check NVIDIA driver version using nvidia-smi."""
+    """Check NVIDIA driver version using nvidia-smi (run once per process)."""
     import subprocess
 
     try:
@@ -93,7 +95,7 @@ def check_nvidia_driver() -> Optional[str]:
             timeout=5,
         )
         if result.returncode == 0:
-            return result.stdout.strip().split("\n")[0]
+            return result.stdout.strip().partition("\n")[0]
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
 
@@ -102,9 +104,8 @@ def check_nvidia_driver() -> Optional[str]:
 
 def print_section(title: str, char: str = "="):
     """Print a section header."""
-    print(f"\n{char * 70}")
-    print(f"  {title}")
-    print(f"{char * 70}\n")
+    rule = char * 70
+    print(f"\n{rule}\n  {title}\n{rule}\n")
 
 
 def print_status(label: str, value: any, success: bool = True):
@@ -1,5 +1,8 @@
 """Pytest configuration and shared fixtures."""
 
+import copy
+import os
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -15,6 +18,103 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
+class _TempDirPool:
+    """Reusable temporary directories, emptied between tests instead of recreated."""
+
+    def __init__(self, size: int = 8):
+        self._all = [Path(tempfile.mkdtemp(prefix="talksmith-pool-")) for _ in range(size)]
+        self._free = list(self._all)
+
+    def acquire(self) -> Path:
+        if not self._free:
+            directory = Path(tempfile.mkdtemp(prefix="talksmith-pool-"))
+            self._all.append(directory)
+            return directory
+        return self._free.pop()
+
+    def release(self, directory: Path) -> None:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        self._free.append(directory)
+
+    def close(self) -> None:
+        for directory in self._all:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def _temp_dir_pool() -> Generator[_TempDirPool, None, None]:
+    pool = _TempDirPool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def pooled_temp_dir(_temp_dir_pool: _TempDirPool) -> Generator[Path, None, None]:
+    """Empty temporary directory drawn from a session-wide pool and emptied afterwards."""
+    directory = _temp_dir_pool.acquire()
+    yield directory
+    _temp_dir_pool.release(directory)
+
+
+@pytest.fixture(scope="session")
+def shared_logger():
+    """Console-only TalkSmith logger built once and shared by tests that don't inspect files."""
+    from pipeline.logger import get_logger
+
+    return get_logger("tests.integration")
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """TalkSmithConfig built once per session; only for tests that don't modify it."""
+    from config.settings import TalkSmithConfig
+
+    return TalkSmithConfig()
+
+
+@pytest.fixture
+def config(default_config):
+    """Independent copy of the session config for tests that call set()."""
+    return copy.copy(default_config)
+
+
+class FakeClock:
+    """Virtual clock standing in for the ``time`` module inside ``pipeline.logger``.
+
+    ``sleep`` advances the clock instantly instead of blocking, so retry/backoff
+    delays can be asserted exactly without spending real wall-clock time.
+    """
+
+    def __init__(self, start: float = 1_000_000.0):
+        self._now = start
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self._now
+
+    now = time
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        self._now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> FakeClock:
+    """Replace the clock used by pipeline.logger retry helpers with a FakeClock."""
+    clock = FakeClock()
+    monkeypatch.setattr("pipeline.logger.time", clock)
+    return clock
+
+
 @pytest.fixture
 def sample_audio_path(temp_dir: Path) -> Path:
     """Create a sample audio file with actual audio data."""
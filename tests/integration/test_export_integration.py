@@ -76,8 +76,7 @@ class TestExportWorkflow:
         assert "00:00:00.000 --> 00:00:03.500" in vtt_content
 
         # Verify JSON structure
-        with open(output_files["json"], encoding="utf-8") as f:
-            json_data = json.load(f)
+        json_data = json.loads(output_files["json"].read_bytes())
         assert len(json_data["segments"]) == 3
         assert json_data["segments"][0]["words"][0]["word"] == "Welcome"
 
@@ -203,8 +202,7 @@ class TestExportWorkflow:
         output_files = export_all(segments, temp_dir, "partial-data")
 
         # Verify JSON handles missing fields correctly
-        with open(output_files["json"], encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_files["json"].read_bytes())
 
         assert "speaker" not in data["segments"][0]
         assert "speaker" in data["segments"][1]
@@ -320,8 +318,7 @@ class TestExportEdgeCases:
         output_file = temp_dir / "words.json"
         export_json(segments, output_file, include_words=True)
 
-        with open(output_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_file.read_bytes())
 
         words = data["segments"][0]["words"]
         assert len(words) == 3
@@ -385,8 +382,7 @@ class TestExportCompatibility:
         export_json(segments, output_file, pretty=False)
 
         # Verify it's valid JSON
-        with open(output_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_file.read_bytes())
 
         # Verify structure suitable for API
         assert "segments" in data
@@ -2,6 +2,8 @@
 
 import pytest
 
+from pipeline.exporters import export_batch
+
 
 @pytest.mark.integration
 @pytest.mark.slow
@@ -19,7 +21,33 @@ class TestFullPipeline:
 
     def test_batch_processing(self, temp_dir):
         """Test batch processing of multiple files."""
-        pass
+        jobs = [
+            (
+                [
+                    {
+                        "start": i * 2.0,
+                        "end": i * 2.0 + 1.5,
+                        "text": f"File {n} segment {i}",
+                        "speaker": f"SPEAKER_{i % 2:02d}",
+                    }
+                    for i in range(10)
+                ],
+                temp_dir / f"file-{n}",
+                f"transcript-{n}",
+            )
+            for n in range(4)
+        ]
+
+        results = export_batch(jobs, workers=2)
+
+        assert len(results) == len(jobs)
+        for n, output_files in enumerate(results):
+            assert set(output_files) == {"txt", "srt", "vtt", "json"}
+            for path in output_files.values():
+                assert path.parent == temp_dir / f"file-{n}"
+                assert path.stem == f"transcript-{n}"
+                assert path.exists()
+            assert f"File {n} segment 9" in output_files["srt"].read_text(encoding="utf-8")
 
     def test_resume_capability(self, temp_dir):
         """Test pipeline can resume from interruption."""
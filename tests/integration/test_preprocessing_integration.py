@@ -4,68 +4,88 @@ Integration tests for audio preprocessing with transcription pipeline.
 Tests the end-to-end integration between AudioPreprocessor and FasterWhisperTranscriber.
 """
 
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
 import numpy as np
 import pytest
 import soundfile as sf
+from faster_whisper import WhisperModel
 
 from pipeline.preprocess import AudioPreprocessor
 from pipeline.transcribe_fw import FasterWhisperTranscriber
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
-def sample_audio_file():
-    """Create a temporary audio file for testing."""
-    # Create a simple sine wave audio (440 Hz, 2 seconds)
-    sample_rate = 16000
-    duration = 2.0
-    frequency = 440
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    audio = 0.5 * np.sin(2 * np.pi * frequency * t)
+_SAMPLE_RATE = 16000
+
+# 440 Hz tone, 2 seconds, computed once at import and shared read-only by the fixtures
+_T = np.linspace(0, 2.0, 2 * _SAMPLE_RATE)
+_SIGNAL = (0.5 * np.sin(2 * np.pi * 440 * _T)).astype(np.float32)
+_SIGNAL.flags.writeable = False
+
+# Fixed-seed background noise for the noisy fixture, so its audio is reproducible
+_NOISE = (0.1 * np.random.default_rng(42).standard_normal(len(_SIGNAL))).astype(np.float32)
+_NOISE.flags.writeable = False
 
+
+@pytest.fixture(scope="module")
+def sample_audio_file(tmp_path_factory):
+    """Create a temporary audio file, shared read-only by every test in the module."""
     # Add some silence at beginning and end
-    silence = np.zeros(int(sample_rate * 0.5))
-    audio_with_silence = np.concatenate([silence, audio, silence])
+    silence = np.zeros(int(_SAMPLE_RATE * 0.5), dtype=np.float32)
+    audio_with_silence = np.concatenate([silence, _SIGNAL, silence])
 
-    # Save to temporary file
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        sf.write(f.name, audio_with_silence, sample_rate)
-        temp_path = Path(f.name)
+    # Save to pytest-managed temporary directory (cleaned up by pytest)
+    temp_path = tmp_path_factory.mktemp("audio") / "sample.wav"
+    sf.write(temp_path, audio_with_silence, _SAMPLE_RATE, subtype="PCM_16")
+    return temp_path
 
-    yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+@pytest.fixture(scope="module")
+def noisy_audio_file(tmp_path_factory):
+    """Create a temporary noisy audio file, shared read-only by every test in the module."""
+    # Signal + noise
+    audio = _SIGNAL + _NOISE
+
+    # Save to pytest-managed temporary directory (cleaned up by pytest)
+    temp_path = tmp_path_factory.mktemp("audio") / "noisy.wav"
+    sf.write(temp_path, audio, _SAMPLE_RATE, subtype="PCM_16")
+    return temp_path
 
 
 @pytest.fixture
-def noisy_audio_file():
-    """Create a temporary noisy audio file for testing."""
-    # Create audio with background noise
-    sample_rate = 16000
-    duration = 2.0
-    frequency = 440
-    t = np.linspace(0, duration, int(sample_rate * duration))
+def mock_segment():
+    """Patch WhisperModel with a model returning one 0-2 s English segment.
 
-    # Signal + noise
-    signal = 0.5 * np.sin(2 * np.pi * frequency * t)
-    noise = 0.1 * np.random.randn(len(t))
-    audio = signal + noise
+    Yields that segment; tests set its ``text``.
+    """
+    with patch("pipeline.transcribe_fw.WhisperModel") as mock_whisper:
+        mock_model = create_autospec(WhisperModel, instance=True)
+        mock_segment = MagicMock()
+        mock_segment.start = 0.0
+        mock_segment.end = 2.0
+        mock_segment.text = "Test transcription"
+        mock_segment.words = []
+
+        mock_info = MagicMock()
+        mock_info.language = "en"
+        mock_info.language_probability = 0.95
 
-    # Save to temporary file
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        sf.write(f.name, audio, sample_rate)
-        temp_path = Path(f.name)
+        mock_model.transcribe.return_value = ([mock_segment], mock_info)
+        mock_whisper.return_value = mock_model
+        yield mock_segment
 
-    yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+def _canned_preprocessing(input_path, output_path):
+    """Return an ``AudioPreprocessor.process`` result without running any DSP."""
+    return output_path, {
+        "input_file": str(input_path),
+        "output_file": str(output_path),
+        "steps_applied": ["loudness_normalization"],
+        "original_duration_seconds": 3.0,
+        "final_duration_seconds": 3.0,
+        "sample_rate": 16000,
+    }
 
 
 class TestPreprocessingIntegration:
@@ -117,23 +137,9 @@ class TestPreprocessingIntegration:
         # Cleanup
         output_path.unlink()
 
-    @patch("pipeline.transcribe_fw.WhisperModel")
-    def test_transcriber_with_preprocessing_disabled(self, mock_whisper, sample_audio_file):
+    def test_transcriber_with_preprocessing_disabled(self, mock_segment, sample_audio_file):
         """Test transcriber without preprocessing."""
-        # Mock the transcribe method
-        mock_model = MagicMock()
-        mock_segment = MagicMock()
-        mock_segment.start = 0.0
-        mock_segment.end = 2.0
         mock_segment.text = "Test transcription"
-        mock_segment.words = []
-
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_info.language_probability = 0.95
-
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
 
         # Initialize transcriber without preprocessing
         transcriber = FasterWhisperTranscriber(
@@ -150,23 +156,11 @@ class TestPreprocessingIntegration:
         assert result["text"] == "Test transcription"
         assert result["language"] == "en"
 
-    @patch("pipeline.transcribe_fw.WhisperModel")
-    def test_transcriber_with_preprocessing_enabled(self, mock_whisper, sample_audio_file):
+    def test_transcriber_with_preprocessing_enabled(
+        self, mock_segment, sample_audio_file, tmp_path
+    ):
         """Test transcriber with preprocessing enabled."""
-        # Mock the transcribe method
-        mock_model = MagicMock()
-        mock_segment = MagicMock()
-        mock_segment.start = 0.0
-        mock_segment.end = 2.0
         mock_segment.text = "Test transcription with preprocessing"
-        mock_segment.words = []
-
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_info.language_probability = 0.95
-
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
 
         # Initialize transcriber with preprocessing
         transcriber = FasterWhisperTranscriber(
@@ -179,32 +173,21 @@ class TestPreprocessingIntegration:
             high_pass_filter=False,  # Disable to avoid scipy dependency issues in CI
         )
 
-        # Transcribe
-        result = transcriber.transcribe(str(sample_audio_file))
+        # Transcribe; the transcriber deletes the preprocessed file, so it must not be the fixture
+        canned = _canned_preprocessing(sample_audio_file, tmp_path / "preprocessed.wav")
+        with patch.object(AudioPreprocessor, "process", return_value=canned) as mock_process:
+            result = transcriber.transcribe(str(sample_audio_file))
 
         # Verify preprocessing was applied
+        mock_process.assert_called_once_with(sample_audio_file)
         assert "preprocessing" in result
         assert "steps_applied" in result["preprocessing"]
         assert len(result["preprocessing"]["steps_applied"]) >= 1
         assert result["text"] == "Test transcription with preprocessing"
 
-    @patch("pipeline.transcribe_fw.WhisperModel")
-    def test_preprocessing_handles_errors_gracefully(self, mock_whisper, sample_audio_file):
+    def test_preprocessing_handles_errors_gracefully(self, mock_segment, sample_audio_file):
         """Test that preprocessing errors are handled gracefully."""
-        # Mock the transcribe method
-        mock_model = MagicMock()
-        mock_segment = MagicMock()
-        mock_segment.start = 0.0
-        mock_segment.end = 2.0
         mock_segment.text = "Fallback transcription"
-        mock_segment.words = []
-
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_info.language_probability = 0.95
-
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
 
         # Create transcriber with preprocessing
         transcriber = FasterWhisperTranscriber(
@@ -222,47 +205,37 @@ class TestPreprocessingIntegration:
         # Verify transcription still works with fallback
         assert result["text"] == "Fallback transcription"
 
-    def test_preprocessing_metrics_in_result(self, sample_audio_file):
+    def test_preprocessing_metrics_in_result(self, mock_segment, sample_audio_file, tmp_path):
         """Test that preprocessing metrics are included in transcription result."""
-        with patch("pipeline.transcribe_fw.WhisperModel") as mock_whisper:
-            # Mock transcribe
-            mock_model = MagicMock()
-            mock_segment = MagicMock()
-            mock_segment.start = 0.0
-            mock_segment.end = 2.0
-            mock_segment.text = "Test"
-            mock_segment.words = []
-
-            mock_info = MagicMock()
-            mock_info.language = "en"
-            mock_info.language_probability = 0.95
-
-            mock_model.transcribe.return_value = ([mock_segment], mock_info)
-            mock_whisper.return_value = mock_model
-
-            # Initialize with preprocessing
-            transcriber = FasterWhisperTranscriber(
-                model_size="base",
-                device="cpu",
-                enable_preprocessing=True,
-                loudnorm=True,
-                trim_silence=True,
-            )
+        mock_segment.text = "Test"
 
+        # Initialize with preprocessing
+        transcriber = FasterWhisperTranscriber(
+            model_size="base",
+            device="cpu",
+            enable_preprocessing=True,
+            loudnorm=True,
+            trim_silence=True,
+        )
+
+        canned = _canned_preprocessing(sample_audio_file, tmp_path / "preprocessed.wav")
+        with patch.object(AudioPreprocessor, "process", return_value=canned):
             result = transcriber.transcribe(str(sample_audio_file))
 
-            # Check preprocessing metrics structure
-            assert "preprocessing" in result
-            preprocessing = result["preprocessing"]
-            assert "input_file" in preprocessing
-            assert "output_file" in preprocessing
-            assert "steps_applied" in preprocessing
-            assert "original_duration_seconds" in preprocessing
-            assert "final_duration_seconds" in preprocessing
-            assert "sample_rate" in preprocessing
+        # Check preprocessing metrics structure
+        assert "preprocessing" in result
+        preprocessing = result["preprocessing"]
+        assert "input_file" in preprocessing
+        assert "output_file" in preprocessing
+        assert "steps_applied" in preprocessing
+        assert "original_duration_seconds" in preprocessing
+        assert "final_duration_seconds" in preprocessing
+        assert "sample_rate" in preprocessing
 
     def test_end_to_end_preprocessing_pipeline(self, noisy_audio_file):
         """Test complete end-to-end preprocessing pipeline."""
+        pytest.importorskip("noisereduce")
+
         # Test the preprocessor standalone
         preprocessor = AudioPreprocessor(
             denoise=True,
@@ -273,28 +246,23 @@ class TestPreprocessingIntegration:
             hpf_cutoff=100,
         )
 
-        try:
-            output_path, metrics = preprocessor.process(noisy_audio_file)
+        output_path, metrics = preprocessor.process(noisy_audio_file)
 
-            # Verify preprocessing completed
-            assert output_path.exists()
-            assert len(metrics["steps_applied"]) >= 2
-
-            # Load both original and preprocessed
-            original_audio, _ = sf.read(noisy_audio_file)
-            processed_audio, _ = sf.read(output_path)
+        # Verify preprocessing completed
+        assert output_path.exists()
+        assert len(metrics["steps_applied"]) >= 2
 
-            # Audio should still have similar length (no trimming)
-            assert abs(len(original_audio) - len(processed_audio)) < 1000
+        # Load both original and preprocessed
+        original_audio, _ = sf.read(noisy_audio_file)
+        processed_audio, _ = sf.read(output_path)
 
-            # Peak levels should be normalized
-            processed_peak = np.abs(processed_audio).max()
-            target_peak = 10 ** (-3.0 / 20.0)  # -3 dBFS
-            assert abs(processed_peak - target_peak) < 0.1
+        # Audio should still have similar length (no trimming)
+        assert abs(len(original_audio) - len(processed_audio)) < 1000
 
-            # Cleanup
-            output_path.unlink()
+        # Peak levels should be normalized
+        processed_peak = np.abs(processed_audio).max()
+        target_peak = 10 ** (-3.0 / 20.0)  # -3 dBFS
+        assert abs(processed_peak - target_peak) < 0.1
 
-        except ImportError as e:
-            # If dependencies are missing, skip the test
-            pytest.skip(f"Preprocessing dependencies not available: {e}")
+        # Cleanup
+        output_path.unlink()
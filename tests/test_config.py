@@ -1,8 +1,13 @@
 """Unit tests for configuration system."""
 
+import configparser
+import copy
+import io
 import os
-import tempfile
+import textwrap
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -12,128 +17,288 @@ from config.settings import TalkSmithConfig, create_default_config, get_config
 class TestTalkSmithConfig:
     """Test configuration loading and access."""
 
-    def test_load_defaults_when_no_file(self):
+    def test_load_defaults_when_no_file(self, pooled_temp_dir):
         """Test that defaults are loaded when no config file exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = os.path.join(tmpdir, "nonexistent.ini")
-            config = TalkSmithConfig(config_path)
+        config_path = os.path.join(pooled_temp_dir, "nonexistent.ini")
+        config = TalkSmithConfig(config_path)
 
-            assert config.get("Models", "whisper_model") == "large-v3"
-            assert config.get("Paths", "input_dir") == "data/inputs"
+        assert config.get("Models", "whisper_model") == "large-v3"
+        assert config.get("Paths", "input_dir") == "data/inputs"
 
-    def test_load_from_file(self):
+    def test_defaults_not_shared_between_instances(self, pooled_temp_dir):
+        """Test changing a defaults-only config leaves later instances untouched."""
+        config_path = os.path.join(pooled_temp_dir, "nonexistent.ini")
+        config = TalkSmithConfig(config_path)
+        config.set("Models", "whisper_model", "tiny")
+        config.set("Extra", "key", "value")
+
+        fresh = TalkSmithConfig(config_path)
+        assert fresh.get("Models", "whisper_model") == "large-v3"
+        assert not fresh.parser.has_section("Extra")
+
+    def test_load_from_file(self, tmp_path):
         """Test loading configuration from file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
-            f.write("[Models]\n")
-            f.write("whisper_model = medium.en\n")
-            f.write("[Paths]\n")
-            f.write("input_dir = /custom/path\n")
-            config_path = f.name
-
-        try:
-            config = TalkSmithConfig(config_path)
-            assert config.get("Models", "whisper_model") == "medium.en"
-            assert config.get("Paths", "input_dir") == "/custom/path"
-        finally:
-            os.unlink(config_path)
-
-    def test_env_var_override(self):
+        config_path = tmp_path / "settings.ini"
+        config_path.write_text(
+            textwrap.dedent(
+                """\
+                [Models]
+                whisper_model = medium.en
+                [Paths]
+                input_dir = /custom/path
+                """
+            )
+        )
+
+        config = TalkSmithConfig(str(config_path))
+        assert config.get("Models", "whisper_model") == "medium.en"
+        assert config.get("Paths", "input_dir") == "/custom/path"
+
+    def test_env_var_override(self, tmp_path, monkeypatch):
         """Test that environment variables override config file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
-            f.write("[Models]\n")
-            f.write("whisper_model = large-v3\n")
-            config_path = f.name
+        config_path = tmp_path / "settings.ini"
+        config_path.write_text("[Models]\nwhisper_model = large-v3\n")
 
-        try:
-            os.environ["TALKSMITH_MODELS_WHISPER_MODEL"] = "tiny.en"
-            config = TalkSmithConfig(config_path)
+        monkeypatch.setenv("TALKSMITH_MODELS_WHISPER_MODEL", "tiny.en")
+        config = TalkSmithConfig(str(config_path))
 
-            assert config.get("Models", "whisper_model") == "tiny.en"
-        finally:
-            del os.environ["TALKSMITH_MODELS_WHISPER_MODEL"]
-            os.unlink(config_path)
+        assert config.get("Models", "whisper_model") == "tiny.en"
 
-    def test_get_int(self):
+    def test_get_int(self, default_config):
         """Test getting integer values."""
-        config = TalkSmithConfig()
-        batch_size = config.get_int("Models", "batch_size")
+        batch_size = default_config.get_int("Models", "batch_size")
         assert isinstance(batch_size, int)
         assert batch_size == 16
 
-    def test_get_float(self):
+    def test_get_float(self, default_config):
         """Test getting float values."""
-        config = TalkSmithConfig()
-        threshold = config.get_float("Diarization", "vad_threshold")
+        threshold = default_config.get_float("Diarization", "vad_threshold")
         assert isinstance(threshold, float)
         assert threshold == 0.5
 
-    def test_get_bool(self):
+    def test_get_bool(self, default_config):
         """Test getting boolean values."""
-        config = TalkSmithConfig()
-        assert config.get_bool("Export", "include_timestamps") is True
-        assert config.get_bool("Processing", "denoise") is False
+        assert default_config.get_bool("Export", "include_timestamps") is True
+        assert default_config.get_bool("Processing", "denoise") is False
 
-    def test_get_list(self):
+    def test_get_list(self, default_config):
         """Test getting list values."""
-        config = TalkSmithConfig()
-        formats = config.get_list("Export", "formats")
+        formats = default_config.get_list("Export", "formats")
         assert isinstance(formats, list)
         assert "txt" in formats
         assert "json" in formats
         assert "srt" in formats
 
-    def test_get_path(self):
+    def test_get_path(self, default_config):
         """Test getting path values."""
-        config = TalkSmithConfig()
-        input_dir = config.get_path("Paths", "input_dir")
+        input_dir = default_config.get_path("Paths", "input_dir")
         assert isinstance(input_dir, Path)
 
-    def test_get_path_create(self):
+    def test_get_path_create(self, config, pooled_temp_dir):
         """Test creating directory when getting path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = TalkSmithConfig()
-            config.set("Paths", "test_dir", os.path.join(tmpdir, "new_dir"))
-
-            new_path = config.get_path("Paths", "test_dir", create=True)
-            assert new_path.exists()
-            assert new_path.is_dir()
-
-    def test_set_and_save(self):
-        """Test setting values and saving to file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
-            config_path = f.name
-
-        try:
-            config = TalkSmithConfig()
-            config.set("Models", "whisper_model", "base.en")
-            config.save(config_path)
-
-            # Load again and verify
-            config2 = TalkSmithConfig(config_path)
-            assert config2.get("Models", "whisper_model") == "base.en"
-        finally:
-            if os.path.exists(config_path):
-                os.unlink(config_path)
-
-    def test_to_dict(self):
+        config.set("Paths", "test_dir", os.path.join(pooled_temp_dir, "new_dir"))
+
+        new_path = config.get_path("Paths", "test_dir", create=True)
+        assert new_path.is_dir()
+
+    def test_get_path_follows_set_and_cwd(self, config, tmp_path, monkeypatch):
+        """Test repeated get_path calls reflect new values and working directories."""
+        config.set("Paths", "test_dir", "data/inputs")
+        monkeypatch.chdir(tmp_path)
+        assert config.get_path("Paths", "test_dir") == tmp_path / "data" / "inputs"
+
+        config.set("Paths", "test_dir", "data/outputs")
+        assert config.get_path("Paths", "test_dir") == tmp_path / "data" / "outputs"
+
+        (tmp_path / "other").mkdir()
+        monkeypatch.chdir(tmp_path / "other")
+        assert config.get_path("Paths", "test_dir") == tmp_path / "other" / "data" / "outputs"
+
+    def test_set_many(self, config):
+        """Test setting values across several sections in one call."""
+        assert config.to_dict()["Models"]["batch_size"] == "16"
+
+        config.set_many(
+            {
+                "Models": {"whisper_model": "tiny", "batch_size": 8},
+                "Extra": {"enabled": True},
+            }
+        )
+
+        assert config.get("Models", "whisper_model") == "tiny"
+        assert config.get_int("Models", "batch_size") == 8
+        assert config.get("Extra", "enabled") == "True"
+        assert config.get("Models", "compute_type") == "float16"
+        assert config.to_dict()["Models"]["batch_size"] == "8"
+
+    def test_set_and_save(self, config):
+        """Test setting values and round-tripping them through serialization."""
+        config.set("Models", "whisper_model", "base.en")
+
+        # Load again and verify
+        config2 = TalkSmithConfig.loads(config.dumps())
+        assert config2.get("Models", "whisper_model") == "base.en"
+        assert config2.to_dict() == config.to_dict()
+        assert config2.config_path is None
+
+    def test_dumps_matches_configparser_write(self):
+        """Test dumps() renders exactly what ConfigParser.write() would."""
+        config = TalkSmithConfig.loads(
+            textwrap.dedent(
+                """\
+                [DEFAULT]
+                shared = yes
+
+                [Models]
+                whisper_model = large-v3
+                prompt = first line
+                    second line
+                progress = 50%%
+                """
+            )
+        )
+        config.set("Export", "formats", "txt,json")
+
+        expected = io.StringIO()
+        config.parser.write(expected)
+        assert config.dumps() == expected.getvalue()
+
+    def test_from_stream(self):
+        """Test loading configuration from an open text stream."""
+        stream = io.StringIO("[Models]\nwhisper_model = small\n")
+
+        config = TalkSmithConfig.from_stream(stream, config_path="stream.ini")
+        assert config.get("Models", "whisper_model") == "small"
+        assert config.config_path == "stream.ini"
+        assert not config.parser.has_section("Paths")
+
+    def test_to_dict(self, default_config):
         """Test converting config to dictionary."""
-        config = TalkSmithConfig()
-        config_dict = config.to_dict()
+        config_dict = default_config.to_dict()
 
         assert isinstance(config_dict, dict)
         assert "Models" in config_dict
         assert "Paths" in config_dict
         assert config_dict["Models"]["whisper_model"] == "large-v3"
 
-    def test_fallback_values(self):
+    def test_to_dict_reflects_set(self, config):
+        """Test to_dict picks up values set after an earlier call."""
+        assert config.to_dict()["Models"]["whisper_model"] == "large-v3"
+
+        config.set("Models", "whisper_model", "tiny")
+        config.set("Extra", "key", "value")
+
+        config_dict = config.to_dict()
+        assert config_dict["Models"]["whisper_model"] == "tiny"
+        assert config_dict["Extra"] == {"key": "value"}
+
+    def test_to_dict_returns_independent_copies(self, config):
+        """Test modifying a returned dict doesn't affect later calls."""
+        config_dict = config.to_dict()
+        config_dict["Models"]["whisper_model"] = "changed"
+        del config_dict["Paths"]
+
+        assert config.to_dict()["Models"]["whisper_model"] == "large-v3"
+        assert "Paths" in config.to_dict()
+
+    def test_fallback_values(self, default_config):
         """Test fallback values when key doesn't exist."""
-        config = TalkSmithConfig()
+        assert default_config.get("NonExistent", "key", fallback="default") == "default"
+        assert default_config.get_int("NonExistent", "key", fallback=42) == 42
+        assert default_config.get_float("NonExistent", "key", fallback=3.14) == 3.14
+        assert default_config.get_bool("NonExistent", "key", fallback=True) is True
+        assert default_config.get_list("NonExistent", "key", fallback=["a", "b"]) == ["a", "b"]
+
+
+class TestBatchedSaves:
+    """Test coalescing saves with batched_saves()."""
+
+    def test_last_save_path_wins(self, config, tmp_path):
+        """Test only the last save inside the block is written."""
+        with config.batched_saves():
+            config.save(str(tmp_path / "first.ini"))
+            config.set("Models", "whisper_model", "tiny")
+            config.save(str(tmp_path / "second.ini"))
+
+        assert not (tmp_path / "first.ini").exists()
+        assert (tmp_path / "second.ini").read_text() == config.dumps()
+
+    def test_nothing_written_when_block_raises(self, config, tmp_path):
+        """Test a failing block discards its pending save."""
+        config_path = tmp_path / "settings.ini"
+
+        with pytest.raises(RuntimeError):
+            with config.batched_saves():
+                config.save(str(config_path))
+                raise RuntimeError("interrupted")
+
+        assert not config_path.exists()
+        config.save(str(config_path))
+        assert config_path.exists()
+
+    def test_nested_blocks_write_once_at_outer_exit(self, config, tmp_path):
+        """Test an inner block defers to the outermost one."""
+        config_path = tmp_path / "settings.ini"
+
+        with config.batched_saves():
+            with config.batched_saves():
+                config.save(str(config_path))
+            assert not config_path.exists()
+
+        assert config_path.exists()
+
+
+class TestConfigCopy:
+    """Test copying configuration instances."""
+
+    def test_copy_is_independent(self, default_config):
+        """Test copy.copy gives a config whose changes don't leak back."""
+        clone = copy.copy(default_config)
+        clone.set("Models", "whisper_model", "tiny")
+        clone.set("NewSection", "key", "value")
+
+        assert clone.get("Models", "whisper_model") == "tiny"
+        assert default_config.get("Models", "whisper_model") == "large-v3"
+        assert not default_config.parser.has_section("NewSection")
+        assert clone.config_path == default_config.config_path
+
+
+class TestConfigParseCache:
+    """Test reuse of parsed config files across instances."""
+
+    @staticmethod
+    def _write_old(path, content):
+        path.write_text(content)
+        old = time.time() - 60
+        os.utime(path, (old, old))
+
+    def test_unchanged_file_parsed_once(self, temp_dir):
+        """Test an unchanged file is only parsed by the first instance."""
+        config_path = temp_dir / "settings.ini"
+        self._write_old(config_path, "[Models]\nwhisper_model = medium.en\n")
+
+        with patch.object(configparser.ConfigParser, "read", autospec=True) as mock_read:
+            mock_read.side_effect = lambda parser, path: parser.read_string(config_path.read_text())
+            config1 = TalkSmithConfig(str(config_path))
+            config2 = TalkSmithConfig(str(config_path))
+
+        assert mock_read.call_count == 1
+        assert config2.get("Models", "whisper_model") == "medium.en"
+
+        # Instances built from the cache stay independent
+        config1.set("Models", "whisper_model", "tiny")
+        assert config2.get("Models", "whisper_model") == "medium.en"
+        assert TalkSmithConfig(str(config_path)).get("Models", "whisper_model") == "medium.en"
+
+    def test_modified_file_reparsed(self, temp_dir):
+        """Test edits to a cached file are picked up."""
+        config_path = temp_dir / "settings.ini"
+        self._write_old(config_path, "[Models]\nwhisper_model = medium.en\n")
+        assert TalkSmithConfig(str(config_path)).get("Models", "whisper_model") == "medium.en"
 
-        assert config.get("NonExistent", "key", fallback="default") == "default"
-        assert config.get_int("NonExistent", "key", fallback=42) == 42
-        assert config.get_float("NonExistent", "key", fallback=3.14) == 3.14
-        assert config.get_bool("NonExistent", "key", fallback=True) is True
-        assert config.get_list("NonExistent", "key", fallback=["a", "b"]) == ["a", "b"]
+        # Same size, fresh mtime
+        config_path.write_text("[Models]\nwhisper_model = distil.en\n")
+        assert TalkSmithConfig(str(config_path)).get("Models", "whisper_model") == "distil.en"
 
 
 class TestGlobalConfig:
@@ -156,36 +321,40 @@ class TestGlobalConfig:
 class TestConfigCreation:
     """Test configuration file creation."""
 
-    def test_create_default_config(self):
+    def test_create_default_config(self, pooled_temp_dir):
         """Test creating default config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = os.path.join(tmpdir, "settings.ini")
-            create_default_config(config_path)
+        config_path = os.path.join(pooled_temp_dir, "settings.ini")
+        create_default_config(config_path)
 
-            assert os.path.exists(config_path)
+        assert os.path.exists(config_path)
 
-            # Verify it can be loaded
-            config = TalkSmithConfig(config_path)
-            assert config.get("Models", "whisper_model") == "large-v3"
+        # Verify it can be loaded
+        config = TalkSmithConfig(config_path)
+        assert config.get("Models", "whisper_model") == "large-v3"
 
 
 class TestConfigFinder:
     """Test configuration file discovery."""
 
-    def test_talksmith_config_env_var(self):
-        """Test TALKSMITH_CONFIG environment variable."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
-            f.write("[Models]\n")
-            f.write("whisper_model = from-env\n")
-            config_path = f.name
-
-        try:
-            os.environ["TALKSMITH_CONFIG"] = config_path
-            config = TalkSmithConfig()
-            assert config.get("Models", "whisper_model") == "from-env"
-        finally:
-            del os.environ["TALKSMITH_CONFIG"]
-            os.unlink(config_path)
+    @pytest.mark.parametrize(
+        "explicit_model,expected",
+        [(None, "env-var"), ("explicit", "explicit")],
+        ids=["env-var", "explicit-path-wins"],
+    )
+    def test_config_path_priority(self, tmp_path, monkeypatch, explicit_model, expected):
+        """Test TALKSMITH_CONFIG is honored unless an explicit config_path is given."""
+        env_path = tmp_path / "env.ini"
+        env_path.write_text("[Models]\nwhisper_model = env-var\n")
+        monkeypatch.setenv("TALKSMITH_CONFIG", str(env_path))
+
+        config_path = None
+        if explicit_model is not None:
+            explicit_path = tmp_path / "explicit.ini"
+            explicit_path.write_text(f"[Models]\nwhisper_model = {explicit_model}\n")
+            config_path = str(explicit_path)
+
+        config = TalkSmithConfig(config_path=config_path)
+        assert config.get("Models", "whisper_model") == expected
 
 
 if __name__ == "__main__":
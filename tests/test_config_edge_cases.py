@@ -1,7 +1,7 @@
 """Additional edge case tests for configuration system."""
 
+import io
 import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -9,295 +9,233 @@ import pytest
 from config.settings import TalkSmithConfig
 
 
+# (section, key, TalkSmithConfig getter, expected default)
+DEFAULT_VALUES = [
+    ("Models", "whisper_model", "get", "large-v3"),
+    ("Models", "whisper_device", "get", "auto"),
+    ("Models", "compute_type", "get", "float16"),
+    ("Models", "batch_size", "get_int", 16),
+    ("Models", "num_workers", "get_int", 4),
+    ("Diarization", "mode", "get", "whisperx"),
+    ("Diarization", "vad_threshold", "get_float", 0.5),
+    ("Diarization", "min_speakers", "get_int", 1),
+    ("Diarization", "max_speakers", "get_int", 10),
+    ("Diarization", "min_segment_length", "get_float", 0.5),
+    ("Export", "formats", "get_list", ["txt", "json", "srt"]),
+    ("Export", "include_timestamps", "get_bool", True),
+    ("Export", "include_confidence", "get_bool", True),
+    ("Export", "word_level", "get_bool", False),
+    ("Processing", "denoise", "get_bool", False),
+    ("Processing", "normalize_audio", "get_bool", True),
+    ("Processing", "trim_silence", "get_bool", False),
+    ("Processing", "sample_rate", "get_int", 16000),
+    ("Logging", "level", "get", "INFO"),
+    ("Logging", "format", "get", "json"),
+    ("Logging", "console_output", "get_bool", True),
+]
+
+
 class TestConfigFinderEdgeCases:
     """Test configuration file discovery edge cases."""
 
-    def test_config_file_priority_explicit_path(self):
-        """Test explicit config_path has highest priority."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".ini", delete=False
-        ) as f1, tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f2:
-            f1.write("[Models]\nwhisper_model = explicit\n")
-            f2.write("[Models]\nwhisper_model = env-var\n")
-            explicit_path = f1.name
-            env_path = f2.name
-
-        try:
-            os.environ["TALKSMITH_CONFIG"] = env_path
-            config = TalkSmithConfig(config_path=explicit_path)
-            assert config.get("Models", "whisper_model") == "explicit"
-        finally:
-            del os.environ["TALKSMITH_CONFIG"]
-            os.unlink(explicit_path)
-            os.unlink(env_path)
-
-    def test_config_finder_returns_default_when_none_exist(self):
+    def test_from_stream_ignores_env_config_path(self, tmp_path, monkeypatch):
+        """Test a config read from a stream is not overridden by TALKSMITH_CONFIG."""
+        env_path = tmp_path / "env.ini"
+        env_path.write_text("[Models]\nwhisper_model = env-var\n")
+
+        monkeypatch.setenv("TALKSMITH_CONFIG", str(env_path))
+        config = TalkSmithConfig.from_stream(io.StringIO("[Models]\nwhisper_model = stream\n"))
+        assert config.get("Models", "whisper_model") == "stream"
+
+    def test_config_finder_returns_default_when_none_exist(self, tmp_path, monkeypatch):
         """Test config finder returns default path when no files exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            old_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir)
-                config = TalkSmithConfig()
-                # Should use defaults even though file doesn't exist
-                assert config.get("Models", "whisper_model") == "large-v3"
-            finally:
-                os.chdir(old_cwd)
+        monkeypatch.delenv("TALKSMITH_CONFIG", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+        config = TalkSmithConfig(search_cwd=tmp_path)
+        assert config.config_path == str(tmp_path / "config" / "settings.ini")
+        # Should use defaults even though file doesn't exist
+        assert config.get("Models", "whisper_model") == "large-v3"
+
+    def test_config_finder_searches_given_directory(self, tmp_path, monkeypatch):
+        """Test config finder looks for settings.ini in search_cwd."""
+        monkeypatch.delenv("TALKSMITH_CONFIG", raising=False)
+        settings_path = tmp_path / "settings.ini"
+        settings_path.write_text("[Models]\nwhisper_model = tiny\n")
+
+        config = TalkSmithConfig(search_cwd=tmp_path)
+        assert config.config_path == str(settings_path)
+        assert config.get("Models", "whisper_model") == "tiny"
+
+
+@pytest.fixture(scope="module")
+def tc_config():
+    """One TalkSmithConfig shared by the type-conversion tests, which only touch "Test"."""
+    return TalkSmithConfig()
 
 
 class TestTypeConversionEdgeCases:
     """Test edge cases in type conversion methods."""
 
-    def test_get_int_with_invalid_string(self):
+    @pytest.fixture(autouse=True)
+    def _reset_test_section(self, tc_config):
+        """Drop the scratch "Test" section after each test."""
+        yield
+        tc_config.parser.remove_section("Test")
+
+    def test_get_int_with_invalid_string(self, tc_config):
         """Test get_int with non-numeric string returns fallback."""
-        config = TalkSmithConfig()
-        config.set("Test", "value", "not-a-number")
-        result = config.get_int("Test", "value", fallback=99)
+        tc_config.set("Test", "value", "not-a-number")
+        result = tc_config.get_int("Test", "value", fallback=99)
         assert result == 99
 
-    def test_get_int_with_float_string(self):
+    def test_get_int_with_float_string(self, tc_config):
         """Test get_int with float string returns fallback."""
-        config = TalkSmithConfig()
-        config.set("Test", "value", "42.7")
-        result = config.get_int("Test", "value", fallback=0)
+        tc_config.set("Test", "value", "42.7")
+        result = tc_config.get_int("Test", "value", fallback=0)
         assert result == 0  # int() raises ValueError on "42.7", so fallback is returned
 
-    def test_get_float_with_invalid_string(self):
+    def test_get_float_with_invalid_string(self, tc_config):
         """Test get_float with non-numeric string returns fallback."""
-        config = TalkSmithConfig()
-        config.set("Test", "value", "invalid")
-        result = config.get_float("Test", "value", fallback=3.14)
+        tc_config.set("Test", "value", "invalid")
+        result = tc_config.get_float("Test", "value", fallback=3.14)
         assert result == 3.14
 
-    def test_get_bool_various_truthy_values(self):
+    @pytest.mark.parametrize(
+        "value", ["true", "True", "TRUE", "yes", "Yes", "YES", "1", "on", "On", "ON"]
+    )
+    def test_get_bool_truthy_values(self, tc_config, value):
         """Test get_bool recognizes various truthy values."""
-        config = TalkSmithConfig()
-        for value in [
-            "true",
-            "True",
-            "TRUE",
-            "yes",
-            "Yes",
-            "YES",
-            "1",
-            "on",
-            "On",
-            "ON",
-        ]:
-            config.set("Test", "bool", value)
-            assert config.get_bool("Test", "bool") is True, f"Failed for: {value}"
-
-    def test_get_bool_various_falsy_values(self):
+        tc_config.set("Test", "bool", value)
+        assert tc_config.get_bool("Test", "bool") is True
+
+    @pytest.mark.parametrize(
+        "value", ["false", "False", "FALSE", "no", "No", "0", "off", "anything-else"]
+    )
+    def test_get_bool_falsy_values(self, tc_config, value):
         """Test get_bool recognizes various falsy values."""
-        config = TalkSmithConfig()
-        for value in [
-            "false",
-            "False",
-            "FALSE",
-            "no",
-            "No",
-            "0",
-            "off",
-            "anything-else",
-        ]:
-            config.set("Test", "bool", value)
-            assert config.get_bool("Test", "bool") is False, f"Failed for: {value}"
-
-    def test_get_list_with_empty_string(self):
+        tc_config.set("Test", "bool", value)
+        assert tc_config.get_bool("Test", "bool") is False
+
+    def test_get_list_with_empty_string(self, tc_config):
         """Test get_list with empty string returns empty list."""
-        config = TalkSmithConfig()
-        config.set("Test", "list", "")
-        result = config.get_list("Test", "list")
+        tc_config.set("Test", "list", "")
+        result = tc_config.get_list("Test", "list")
         assert result == []
 
-    def test_get_list_with_custom_separator(self):
+    def test_get_list_with_custom_separator(self, tc_config):
         """Test get_list with custom separator."""
-        config = TalkSmithConfig()
-        config.set("Test", "list", "a|b|c")
-        result = config.get_list("Test", "list", separator="|")
+        tc_config.set("Test", "list", "a|b|c")
+        result = tc_config.get_list("Test", "list", separator="|")
         assert result == ["a", "b", "c"]
 
-    def test_get_list_strips_whitespace(self):
+    def test_get_list_strips_whitespace(self, tc_config):
         """Test get_list strips whitespace from items."""
-        config = TalkSmithConfig()
-        config.set("Test", "list", "a , b  ,  c")
-        result = config.get_list("Test", "list")
+        tc_config.set("Test", "list", "a , b  ,  c")
+        result = tc_config.get_list("Test", "list")
         assert result == ["a", "b", "c"]
 
-    def test_get_list_ignores_empty_items(self):
+    def test_get_list_ignores_empty_items(self, tc_config):
         """Test get_list ignores empty items."""
-        config = TalkSmithConfig()
-        config.set("Test", "list", "a,,b,,,c")
-        result = config.get_list("Test", "list")
+        tc_config.set("Test", "list", "a,,b,,,c")
+        result = tc_config.get_list("Test", "list")
         assert result == ["a", "b", "c"]
 
-    def test_get_path_with_none_value(self):
+    def test_get_path_with_none_value(self, default_config):
         """Test get_path returns None when value is None."""
-        config = TalkSmithConfig()
-        result = config.get_path("NonExistent", "key", fallback=None)
+        result = default_config.get_path("NonExistent", "key", fallback=None)
         assert result is None
 
-    def test_get_path_expands_user_home(self):
+    def test_get_path_expands_user_home(self, tc_config):
         """Test get_path expands ~ to user home."""
-        config = TalkSmithConfig()
-        config.set("Test", "path", "~/test")
-        result = config.get_path("Test", "path")
+        tc_config.set("Test", "path", "~/test")
+        result = tc_config.get_path("Test", "path")
         assert "~" not in str(result)
         assert str(result).startswith(str(Path.home()))
 
-    def test_get_path_makes_relative_absolute(self):
+    def test_get_path_makes_relative_absolute(self, tc_config):
         """Test get_path converts relative to absolute."""
-        config = TalkSmithConfig()
-        config.set("Test", "path", "relative/path")
-        result = config.get_path("Test", "path")
+        tc_config.set("Test", "path", "relative/path")
+        result = tc_config.get_path("Test", "path")
         assert result.is_absolute()
 
-    def test_get_path_create_nested_dirs(self):
+    def test_get_path_create_nested_dirs(self, tc_config, pooled_temp_dir):
         """Test get_path can create nested directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = TalkSmithConfig()
-            nested_path = os.path.join(tmpdir, "a", "b", "c", "deep")
-            config.set("Test", "path", nested_path)
-            result = config.get_path("Test", "path", create=True)
-            assert result.exists()
-            assert result.is_dir()
+        nested_path = os.path.join(pooled_temp_dir, "a", "b", "c", "deep")
+        tc_config.set("Test", "path", nested_path)
+        result = tc_config.get_path("Test", "path", create=True)
+        assert result.is_dir()
 
 
 class TestEnvironmentVariableEdgeCases:
     """Test edge cases with environment variable overrides."""
 
-    def test_env_var_with_empty_string(self):
+    def test_env_var_with_empty_string(self, default_config, monkeypatch):
         """Test environment variable with empty string value."""
-        config = TalkSmithConfig()
-        try:
-            os.environ["TALKSMITH_MODELS_WHISPER_MODEL"] = ""
-            result = config.get("Models", "whisper_model")
-            assert result == ""
-        finally:
-            del os.environ["TALKSMITH_MODELS_WHISPER_MODEL"]
-
-    def test_env_var_with_special_characters(self):
+        monkeypatch.setenv("TALKSMITH_MODELS_WHISPER_MODEL", "")
+        result = default_config.get("Models", "whisper_model")
+        assert result == ""
+
+    def test_env_var_with_special_characters(self, default_config, monkeypatch):
         """Test environment variable with special characters."""
-        config = TalkSmithConfig()
-        try:
-            os.environ["TALKSMITH_PATHS_INPUT_DIR"] = "/path/with spaces/and-dashes"
-            result = config.get("Paths", "input_dir")
-            assert result == "/path/with spaces/and-dashes"
-        finally:
-            del os.environ["TALKSMITH_PATHS_INPUT_DIR"]
-
-    def test_multiple_env_vars_override(self):
+        monkeypatch.setenv("TALKSMITH_PATHS_INPUT_DIR", "/path/with spaces/and-dashes")
+        result = default_config.get("Paths", "input_dir")
+        assert result == "/path/with spaces/and-dashes"
+
+    def test_multiple_env_vars_override(self, default_config, monkeypatch):
         """Test multiple environment variables can override config."""
-        config = TalkSmithConfig()
-        try:
-            os.environ["TALKSMITH_MODELS_WHISPER_MODEL"] = "tiny"
-            os.environ["TALKSMITH_MODELS_BATCH_SIZE"] = "32"
-            os.environ["TALKSMITH_DIARIZATION_MODE"] = "off"
-
-            assert config.get("Models", "whisper_model") == "tiny"
-            assert config.get_int("Models", "batch_size") == 32
-            assert config.get("Diarization", "mode") == "off"
-        finally:
-            for key in [
-                "TALKSMITH_MODELS_WHISPER_MODEL",
-                "TALKSMITH_MODELS_BATCH_SIZE",
-                "TALKSMITH_DIARIZATION_MODE",
-            ]:
-                if key in os.environ:
-                    del os.environ[key]
+        monkeypatch.setenv("TALKSMITH_MODELS_WHISPER_MODEL", "tiny")
+        monkeypatch.setenv("TALKSMITH_MODELS_BATCH_SIZE", "32")
+        monkeypatch.setenv("TALKSMITH_DIARIZATION_MODE", "off")
+
+        assert default_config.get("Models", "whisper_model") == "tiny"
+        assert default_config.get_int("Models", "batch_size") == 32
+        assert default_config.get("Diarization", "mode") == "off"
 
 
 class TestConfigurationDefaults:
     """Test default configuration values are correct."""
 
-    def test_all_default_sections_present(self):
+    def test_all_default_sections_present(self, default_config):
         """Test all expected default sections are present."""
-        config = TalkSmithConfig()
-        expected_sections = [
-            "Paths",
-            "Models",
-            "Diarization",
-            "Export",
-            "Processing",
-            "Logging",
-        ]
-
-        for section in expected_sections:
-            assert config.parser.has_section(section), f"Missing default section: {section}"
-
-    def test_default_models_section(self):
-        """Test default Models section values."""
-        config = TalkSmithConfig()
-        assert config.get("Models", "whisper_model") == "large-v3"
-        assert config.get("Models", "whisper_device") == "auto"
-        assert config.get("Models", "compute_type") == "float16"
-        assert config.get_int("Models", "batch_size") == 16
-        assert config.get_int("Models", "num_workers") == 4
-
-    def test_default_diarization_section(self):
-        """Test default Diarization section values."""
-        config = TalkSmithConfig()
-        assert config.get("Diarization", "mode") == "whisperx"
-        assert config.get_float("Diarization", "vad_threshold") == 0.5
-        assert config.get_int("Diarization", "min_speakers") == 1
-        assert config.get_int("Diarization", "max_speakers") == 10
-        assert config.get_float("Diarization", "min_segment_length") == 0.5
-
-    def test_default_export_section(self):
-        """Test default Export section values."""
-        config = TalkSmithConfig()
-        formats = config.get_list("Export", "formats")
-        assert "txt" in formats
-        assert "json" in formats
-        assert "srt" in formats
-        assert config.get_bool("Export", "include_timestamps") is True
-        assert config.get_bool("Export", "include_confidence") is True
-        assert config.get_bool("Export", "word_level") is False
-
-    def test_default_processing_section(self):
-        """Test default Processing section values."""
-        config = TalkSmithConfig()
-        assert config.get_bool("Processing", "denoise") is False
-        assert config.get_bool("Processing", "normalize_audio") is True
-        assert config.get_bool("Processing", "trim_silence") is False
-        assert config.get_int("Processing", "sample_rate") == 16000
-
-    def test_default_logging_section(self):
-        """Test default Logging section values."""
-        config = TalkSmithConfig()
-        assert config.get("Logging", "level") == "INFO"
-        assert config.get("Logging", "format") == "json"
-        assert config.get_bool("Logging", "console_output") is True
+        expected_sections = {"Paths", "Models", "Diarization", "Export", "Processing", "Logging"}
+
+        # Report every missing section at once rather than stopping at the first
+        missing = expected_sections - set(default_config.parser.sections())
+        assert not missing, f"Missing default sections: {sorted(missing)}"
+
+    @pytest.mark.parametrize("section,key,getter,expected", DEFAULT_VALUES)
+    def test_default_value(self, default_config, section, key, getter, expected):
+        """Test each default value, read through the typed getter used in the pipeline."""
+        assert getattr(default_config, getter)(section, key) == expected
 
 
 class TestConfigurationErrorHandling:
     """Test error handling and edge cases."""
 
-    def test_set_creates_section_if_not_exists(self):
+    def test_set_creates_section_if_not_exists(self, config):
         """Test set creates section if it doesn't exist."""
-        config = TalkSmithConfig()
         config.set("NewSection", "new_key", "new_value")
 
         assert config.parser.has_section("NewSection")
         assert config.get("NewSection", "new_key") == "new_value"
 
-    def test_get_with_none_fallback(self):
+    def test_get_with_none_fallback(self, default_config):
         """Test get with None fallback returns None."""
-        config = TalkSmithConfig()
-        result = config.get("NonExistent", "key", fallback=None)
+        result = default_config.get("NonExistent", "key", fallback=None)
         assert result is None
 
-    def test_save_creates_parent_directory(self):
+    def test_save_creates_parent_directory(self, config, pooled_temp_dir):
         """Test save creates parent directories if they don't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = os.path.join(tmpdir, "nested", "dir", "config.ini")
-            config = TalkSmithConfig()
-            config.set("Models", "whisper_model", "test")
-            config.save(config_path)
-
-            assert os.path.exists(config_path)
-            # Verify it can be loaded
-            config2 = TalkSmithConfig(config_path)
-            assert config2.get("Models", "whisper_model") == "test"
+        config_path = os.path.join(pooled_temp_dir, "nested", "dir", "config.ini")
+        config.set("Models", "whisper_model", "test")
+        config.save(config_path)
+
+        assert os.path.exists(config_path)
+        assert Path(config_path).read_text() == config.dumps()
+        # Verify it can be loaded
+        config2 = TalkSmithConfig(config_path)
+        assert config2.get("Models", "whisper_model") == "test"
 
 
 if __name__ == "__main__":
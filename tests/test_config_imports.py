@@ -46,48 +46,34 @@ class TestConfigModuleImports:
 class TestConfigCLIExecution:
     """Test config module CLI execution."""
 
-    def test_settings_module_cli_creates_default_config(self, temp_dir, monkeypatch):
+    def test_settings_module_cli_creates_default_config(self, temp_dir, monkeypatch, capsys):
         """Test running settings.py as script creates config file."""
-        import subprocess
         import sys
 
+        from config.settings import main
+
         config_path = temp_dir / "cli_test_settings.ini"
 
-        # Run the settings module as a script
-        result = subprocess.run(
-            [sys.executable, "-m", "config.settings", str(config_path)],
-            capture_output=True,
-            text=True,
-        )
+        # Run the settings module's CLI entry point in-process
+        monkeypatch.setattr(sys, "argv", ["settings.py", str(config_path)])
+        main()
 
-        assert result.returncode == 0
         assert config_path.exists()
-        assert "Created default configuration" in result.stdout
+        assert "Created default configuration" in capsys.readouterr().out
 
-    def test_settings_module_cli_default_path(self, temp_dir, monkeypatch):
+    def test_settings_module_cli_default_path(self, temp_dir, monkeypatch, capsys):
         """Test running settings.py without args uses default path."""
-        import os
-        import subprocess
         import sys
 
-        # Change to temp directory
-        old_cwd = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            # Add current working directory to PYTHONPATH
-            env = os.environ.copy()
-            env["PYTHONPATH"] = old_cwd
-            result = subprocess.run(
-                [sys.executable, "-m", "config.settings"],
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-
-            assert result.returncode == 0
-            assert "Created default configuration" in result.stdout
-        finally:
-            os.chdir(old_cwd)
+        from config.settings import main
+
+        # The default path is relative to the working directory
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(sys, "argv", ["settings.py"])
+        main()
+
+        assert (temp_dir / "config" / "settings.ini").exists()
+        assert "Created default configuration" in capsys.readouterr().out
 
 
 class TestConfigThreadSafety:
@@ -95,103 +81,72 @@ class TestConfigThreadSafety:
 
     def test_concurrent_config_reads(self):
         """Test multiple threads can read config simultaneously."""
-        import threading
+        from concurrent.futures import ThreadPoolExecutor
 
         from config import get_config
 
-        results = []
-        errors = []
-
-        def read_config():
-            try:
-                config = get_config()
-                value = config.get("Models", "whisper_model")
-                results.append(value)
-            except Exception as e:
-                errors.append(e)
-
-        threads = [threading.Thread(target=read_config) for _ in range(10)]
+        def read_config(_):
+            return get_config().get("Models", "whisper_model")
 
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        # Any exception raised in a worker is re-raised here by list()
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            results = list(pool.map(read_config, range(10)))
 
-        assert len(errors) == 0, f"Errors occurred: {errors}"
         assert len(results) == 10
         assert all(r == results[0] for r in results)
 
     def test_concurrent_config_writes(self, temp_dir):
         """Test multiple threads writing to different config instances."""
-        import threading
+        from concurrent.futures import ThreadPoolExecutor
 
         from config.settings import TalkSmithConfig
 
-        errors = []
-
         def write_config(thread_id):
-            try:
-                config = TalkSmithConfig()
-                config.set("Test", f"thread_{thread_id}", str(thread_id))
-                config_path = temp_dir / f"config_{thread_id}.ini"
-                config.save(str(config_path))
-                assert config_path.exists()
-            except Exception as e:
-                errors.append(e)
-
-        threads = [threading.Thread(target=write_config, args=(i,)) for i in range(5)]
+            config = TalkSmithConfig()
+            config.set("Test", f"thread_{thread_id}", str(thread_id))
+            config_path = temp_dir / f"config_{thread_id}.ini"
+            config.save(str(config_path))
+            return config_path
 
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            config_paths = list(pool.map(write_config, range(5)))
 
-        assert len(errors) == 0, f"Errors occurred: {errors}"
+        for thread_id, config_path in enumerate(config_paths):
+            saved = TalkSmithConfig(str(config_path))
+            assert saved.get("Test", f"thread_{thread_id}") == str(thread_id)
 
 
 class TestConfigPathHandling:
     """Test path handling across different platforms."""
 
-    def test_windows_path_with_backslashes(self):
+    def test_windows_path_with_backslashes(self, config):
         """Test handling Windows-style paths with backslashes."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
         config.set("Paths", "test_path", r"C:\Users\test\data")
 
         path = config.get_path("Paths", "test_path")
         assert path is not None
         assert isinstance(path, Path)
 
-    def test_unix_path_with_forward_slashes(self):
+    def test_unix_path_with_forward_slashes(self, config):
         """Test handling Unix-style paths."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
         config.set("Paths", "test_path", "/home/user/data")
 
         path = config.get_path("Paths", "test_path")
         assert path is not None
         assert isinstance(path, Path)
 
-    def test_mixed_path_separators(self):
+    def test_mixed_path_separators(self, config):
         """Test handling paths with mixed separators."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
         config.set("Paths", "test_path", r"C:/Users\test/data")
 
         path = config.get_path("Paths", "test_path")
         assert path is not None
         assert isinstance(path, Path)
 
-    def test_path_with_trailing_separator(self):
+    def test_path_with_trailing_separator(self, config):
         """Test paths with trailing separators are handled correctly."""
         import os
 
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
         config.set("Paths", "test_path", "data/test/")
 
         path = config.get_path("Paths", "test_path")
@@ -202,56 +157,38 @@ class TestConfigPathHandling:
 class TestConfigValidation:
     """Test configuration validation and error handling."""
 
-    def test_get_int_with_none_value(self):
+    def test_get_int_with_none_value(self, default_config):
         """Test get_int when key returns None."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
-        result = config.get_int("NonExistent", "key", fallback=42)
+        result = default_config.get_int("NonExistent", "key", fallback=42)
         assert result == 42
 
-    def test_get_float_with_none_value(self):
+    def test_get_float_with_none_value(self, default_config):
         """Test get_float when key returns None."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
-        result = config.get_float("NonExistent", "key", fallback=3.14)
+        result = default_config.get_float("NonExistent", "key", fallback=3.14)
         assert result == 3.14
 
-    def test_get_bool_with_none_value(self):
+    def test_get_bool_with_none_value(self, default_config):
         """Test get_bool when key returns None."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
-        result = config.get_bool("NonExistent", "key", fallback=True)
+        result = default_config.get_bool("NonExistent", "key", fallback=True)
         assert result is True
 
-    def test_get_list_preserves_order(self):
+    def test_get_list_preserves_order(self, config):
         """Test get_list preserves item order."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
         config.set("Test", "ordered_list", "z,y,x,w,v")
 
         result = config.get_list("Test", "ordered_list")
         assert result == ["z", "y", "x", "w", "v"]
 
-    def test_get_list_with_single_item(self):
+    def test_get_list_with_single_item(self, config):
         """Test get_list with single item (no separator)."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
         config.set("Test", "single", "item")
 
         result = config.get_list("Test", "single")
         assert result == ["item"]
 
-    def test_to_dict_includes_all_sections(self):
+    def test_to_dict_includes_all_sections(self, default_config):
         """Test to_dict returns all sections."""
-        from config.settings import TalkSmithConfig
-
-        config = TalkSmithConfig()
-        config_dict = config.to_dict()
+        config_dict = default_config.to_dict()
 
         expected_sections = [
             "Paths",
@@ -271,25 +208,17 @@ class TestConfigFileDiscovery:
 
     def test_finds_settings_in_cwd(self, temp_dir, monkeypatch):
         """Test config finder locates settings.ini in current directory."""
-        import os
-
         from config.settings import TalkSmithConfig
 
         settings_path = temp_dir / "settings.ini"
         settings_path.write_text("[Test]\nkey = cwd\n")
 
-        old_cwd = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            config = TalkSmithConfig()
-            assert config.get("Test", "key") == "cwd"
-        finally:
-            os.chdir(old_cwd)
+        monkeypatch.delenv("TALKSMITH_CONFIG", raising=False)
+        config = TalkSmithConfig(search_cwd=temp_dir)
+        assert config.get("Test", "key") == "cwd"
 
     def test_finds_settings_in_config_subdir(self, temp_dir, monkeypatch):
         """Test config finder locates settings.ini in config/ subdirectory."""
-        import os
-
         from config.settings import TalkSmithConfig
 
         config_dir = temp_dir / "config"
@@ -297,48 +226,34 @@ class TestConfigFileDiscovery:
         settings_path = config_dir / "settings.ini"
         settings_path.write_text("[Test]\nkey = config-subdir\n")
 
-        old_cwd = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            config = TalkSmithConfig()
-            assert config.get("Test", "key") == "config-subdir"
-        finally:
-            os.chdir(old_cwd)
+        monkeypatch.delenv("TALKSMITH_CONFIG", raising=False)
+        config = TalkSmithConfig(search_cwd=temp_dir)
+        assert config.get("Test", "key") == "config-subdir"
 
 
 class TestConfigReload:
     """Test configuration reloading behavior."""
 
-    def test_reload_updates_values(self, temp_dir):
+    def test_reload_updates_values(self, temp_dir, monkeypatch):
         """Test that reload=True loads updated config values."""
-        import os
-
         from config import get_config
 
         config_path = temp_dir / "test_reload.ini"
         config_path.write_text("[Models]\nwhisper_model = small\n")
 
         # Set env var to use our test config
-        old_env = os.environ.get("TALKSMITH_CONFIG")
-        try:
-            os.environ["TALKSMITH_CONFIG"] = str(config_path)
-
-            # First load
-            config1 = get_config(reload=True)
-            assert config1.get("Models", "whisper_model") == "small"
-
-            # Modify file
-            config_path.write_text("[Models]\nwhisper_model = large\n")
-
-            # Reload
-            config2 = get_config(reload=True)
-            assert config2.get("Models", "whisper_model") == "large"
-
-        finally:
-            if old_env:
-                os.environ["TALKSMITH_CONFIG"] = old_env
-            elif "TALKSMITH_CONFIG" in os.environ:
-                del os.environ["TALKSMITH_CONFIG"]
+        monkeypatch.setenv("TALKSMITH_CONFIG", str(config_path))
+
+        # First load
+        config1 = get_config(reload=True)
+        assert config1.get("Models", "whisper_model") == "small"
+
+        # Modify file
+        config_path.write_text("[Models]\nwhisper_model = large\n")
+
+        # Reload
+        config2 = get_config(reload=True)
+        assert config2.get("Models", "whisper_model") == "large"
 
     def test_reload_clears_singleton(self):
         """Test reload creates new instance."""
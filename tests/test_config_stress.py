@@ -1,28 +1,34 @@
 """Stress tests for configuration system."""
 
+import io
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from config.settings import TalkSmithConfig, get_config
 
+# 1000-item list for the get_list stress test, built once at import
+MANY_ITEMS = [f"item{i:04d}" for i in range(1000)]
+MANY_ITEMS_STR = ",".join(MANY_ITEMS)
+
 
 class TestConfigStress:
     """Stress tests for configuration system."""
 
-    def test_large_config_file(self, temp_dir):
+    def test_large_config_file(self, config, temp_dir):
         """Test handling config file with many sections and keys."""
-        config = TalkSmithConfig()
-
         # Add 100 sections with 50 keys each
-        for section_num in range(100):
-            section = f"Section{section_num:03d}"
-            for key_num in range(50):
-                key = f"key{key_num:03d}"
-                value = f"value_{section_num}_{key_num}"
-                config.set(section, key, value)
+        config.set_many(
+            {
+                f"Section{section_num:03d}": {
+                    f"key{key_num:03d}": f"value_{section_num}_{key_num}" for key_num in range(50)
+                }
+                for section_num in range(100)
+            }
+        )
 
         # Verify we can save and reload
         config_path = temp_dir / "large_config.ini"
@@ -33,10 +39,13 @@ class TestConfigStress:
         assert config2.get("Section050", "key025") == "value_50_25"
         assert config2.get("Section099", "key049") == "value_99_49"
 
-    def test_very_long_values(self):
-        """Test handling very long configuration values."""
-        config = TalkSmithConfig()
+        # The single-join writer must match configparser's own output exactly
+        expected = io.StringIO()
+        config.parser.write(expected)
+        assert config_path.read_text() == expected.getvalue()
 
+    def test_very_long_values(self, config):
+        """Test handling very long configuration values."""
         # 10KB value
         long_value = "x" * 10000
         config.set("Test", "long_value", long_value)
@@ -45,59 +54,48 @@ class TestConfigStress:
         assert retrieved == long_value
         assert len(retrieved) == 10000
 
-    def test_special_characters_in_values(self):
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("value with spaces", id="spaces"),
+            pytest.param("value\twith\ttabs", id="tabs"),
+            pytest.param("value\nwith\nnewlines", id="newlines"),
+            pytest.param("value=with=equals", id="equals"),
+            pytest.param("value:with:colons", id="colons"),
+            pytest.param("value;with;semicolons", id="semicolons"),
+            pytest.param("value#with#hashes", id="hashes"),
+            pytest.param('value"with"quotes', id="quotes"),
+            pytest.param("value'with'apostrophes", id="apostrophes"),
+            pytest.param("value\\with\\backslashes", id="backslashes"),
+            pytest.param("value/with/slashes", id="slashes"),
+            pytest.param("value@with@special!chars$", id="special-chars"),
+        ],
+    )
+    def test_special_characters_in_values(self, config, value):
         """Test handling special characters in values."""
-        config = TalkSmithConfig()
-
-        special_values = [
-            "value with spaces",
-            "value\twith\ttabs",
-            "value\nwith\nnewlines",
-            "value=with=equals",
-            "value:with:colons",
-            "value;with;semicolons",
-            "value#with#hashes",
-            'value"with"quotes',
-            "value'with'apostrophes",
-            "value\\with\\backslashes",
-            "value/with/slashes",
-            "value@with@special!chars$",
-        ]
-
-        for i, value in enumerate(special_values):
-            config.set("Special", f"key{i}", value)
-
-        # Verify retrieval
-        for i, expected in enumerate(special_values):
-            retrieved = config.get("Special", f"key{i}")
-            assert retrieved == expected
-
-    def test_unicode_in_values(self):
+        config.set("Special", "key", value)
+        assert config.get("Special", "key") == value
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("日本語", id="japanese"),
+            pytest.param("العربية", id="arabic"),
+            pytest.param("Русский", id="russian"),
+            pytest.param("中文", id="chinese"),
+            pytest.param("Ελληνικά", id="greek"),
+            pytest.param("한국어", id="korean"),
+            pytest.param("עברית", id="hebrew"),
+            pytest.param("🚀🎯💡", id="emojis"),
+        ],
+    )
+    def test_unicode_in_values(self, config, value):
         """Test handling Unicode characters in values."""
-        config = TalkSmithConfig()
-
-        unicode_values = [
-            "日本語",  # Japanese
-            "العربية",  # Arabic
-            "Русский",  # Russian
-            "中文",  # Chinese
-            "Ελληνικά",  # Greek
-            "한국어",  # Korean
-            "עברית",  # Hebrew
-            "🚀🎯💡",  # Emojis
-        ]
-
-        for i, value in enumerate(unicode_values):
-            config.set("Unicode", f"key{i}", value)
+        config.set("Unicode", "key", value)
+        assert config.get("Unicode", "key") == value
 
-        # Verify retrieval
-        for i, expected in enumerate(unicode_values):
-            retrieved = config.get("Unicode", f"key{i}")
-            assert retrieved == expected
-
-    def test_rapid_sequential_saves(self, temp_dir):
+    def test_rapid_sequential_saves(self, config, temp_dir):
         """Test rapid sequential save operations."""
-        config = TalkSmithConfig()
         config_path = temp_dir / "rapid_save.ini"
 
         # Perform 50 rapid saves
@@ -109,10 +107,24 @@ class TestConfigStress:
         config2 = TalkSmithConfig(str(config_path))
         assert config2.get("Test", "counter") == "49"
 
-    def test_many_env_var_overrides(self, monkeypatch):
-        """Test handling many environment variable overrides."""
-        config = TalkSmithConfig()
+    def test_rapid_saves_batched(self, config, temp_dir):
+        """Test 50 saves inside batched_saves() write the file once."""
+        config_path = temp_dir / "batched_save.ini"
 
+        with patch("builtins.open", wraps=open) as mock_open:
+            with config.batched_saves():
+                for i in range(50):
+                    config.set("Test", "counter", str(i))
+                    config.save(str(config_path))
+
+                assert not config_path.exists()
+
+        mock_open.assert_called_once_with(str(config_path), "w")
+        config2 = TalkSmithConfig(str(config_path))
+        assert config2.get("Test", "counter") == "49"
+
+    def test_many_env_var_overrides(self, default_config, monkeypatch):
+        """Test handling many environment variable overrides."""
         # Set 100 environment variables
         for i in range(100):
             env_key = f"TALKSMITH_ENVTEST_KEY{i:03d}"
@@ -121,13 +133,11 @@ class TestConfigStress:
         # Verify all are read correctly
         for i in range(100):
             key = f"key{i:03d}"
-            value = config.get("EnvTest", key)
+            value = default_config.get("EnvTest", key)
             assert value == f"value{i}"
 
-    def test_get_int_boundary_values(self):
+    def test_get_int_boundary_values(self, config):
         """Test get_int with boundary values."""
-        config = TalkSmithConfig()
-
         test_cases = [
             ("0", 0),
             ("-1", -1),
@@ -136,15 +146,15 @@ class TestConfigStress:
             ("9223372036854775807", 9223372036854775807),  # Max 64-bit int
         ]
 
-        for str_value, expected_int in test_cases:
-            config.set("Boundary", "value", str_value)
-            result = config.get_int("Boundary", "value")
+        # Load every case in one call, one key per case
+        config.set_many({"Boundary": {f"v{i}": s for i, (s, _) in enumerate(test_cases)}})
+
+        for i, (_, expected_int) in enumerate(test_cases):
+            result = config.get_int("Boundary", f"v{i}")
             assert result == expected_int
 
-    def test_get_float_boundary_values(self):
+    def test_get_float_boundary_values(self, config):
         """Test get_float with boundary values."""
-        config = TalkSmithConfig()
-
         test_cases = [
             ("0.0", 0.0),
             ("-0.0", -0.0),
@@ -154,28 +164,21 @@ class TestConfigStress:
             ("-999999.999999", -999999.999999),
         ]
 
-        for str_value, expected_float in test_cases:
-            config.set("Boundary", "value", str_value)
-            result = config.get_float("Boundary", "value")
+        config.set_many({"Boundary": {f"v{i}": s for i, (s, _) in enumerate(test_cases)}})
+
+        for i, (_, expected_float) in enumerate(test_cases):
+            result = config.get_float("Boundary", f"v{i}")
             assert abs(result - expected_float) < 1e-10
 
-    def test_get_list_with_many_items(self):
+    def test_get_list_with_many_items(self, config):
         """Test get_list with many items."""
-        config = TalkSmithConfig()
-
-        # Create list with 1000 items
-        items = [f"item{i:04d}" for i in range(1000)]
-        config.set("Test", "many_items", ",".join(items))
+        config.set("Test", "many_items", MANY_ITEMS_STR)
 
         result = config.get_list("Test", "many_items")
-        assert len(result) == 1000
-        assert result[0] == "item0000"
-        assert result[999] == "item0999"
+        assert result == MANY_ITEMS
 
-    def test_path_creation_deep_nesting(self, temp_dir):
+    def test_path_creation_deep_nesting(self, config, temp_dir):
         """Test creating deeply nested directory paths."""
-        config = TalkSmithConfig()
-
         # Create path with 20 levels of nesting
         deep_path = temp_dir
         for i in range(20):
@@ -184,14 +187,11 @@ class TestConfigStress:
         config.set("Paths", "deep", str(deep_path))
         result = config.get_path("Paths", "deep", create=True)
 
-        assert result.exists()
         assert result.is_dir()
 
-    def test_config_dict_iteration(self):
+    def test_config_dict_iteration(self, default_config):
         """Test iterating over config dictionary."""
-        config = TalkSmithConfig()
-
-        config_dict = config.to_dict()
+        config_dict = default_config.to_dict()
 
         # Count total keys across all sections
         total_keys = sum(len(section_dict) for section_dict in config_dict.values())
@@ -256,20 +256,16 @@ class TestConfigErrorRecovery:
         # Empty file is valid but has no sections, so get returns None/fallback
         assert config.get("Models", "whisper_model", fallback="default") == "default"
 
-    def test_config_file_with_only_comments(self, temp_dir):
+    def test_config_file_with_only_comments(self):
         """Test handling of config file with only comments."""
-        config_path = temp_dir / "comments.ini"
-        config_path.write_text("# This is a comment\n; This is also a comment\n")
-
-        config = TalkSmithConfig(str(config_path))
+        config = TalkSmithConfig.loads("# This is a comment\n; This is also a comment\n")
         # File with only comments is valid but has no sections
         assert config.get("Models", "whisper_model", fallback="default") == "default"
 
-    def test_readonly_directory_save(self, temp_dir):
+    def test_readonly_directory_save(self, config, temp_dir):
         """Test save behavior when directory is read-only."""
         import stat
 
-        config = TalkSmithConfig()
         readonly_dir = temp_dir / "readonly"
         readonly_dir.mkdir()
 
@@ -285,10 +281,8 @@ class TestConfigErrorRecovery:
                 # Restore write permissions
                 readonly_dir.chmod(stat.S_IRWXU)
 
-    def test_invalid_path_characters(self):
+    def test_invalid_path_characters(self, config):
         """Test handling paths with invalid characters."""
-        config = TalkSmithConfig()
-
         # These might be invalid on different platforms
         # Just verify no crashes occur
         try:
@@ -308,10 +302,8 @@ class TestConfigErrorRecovery:
 class TestConfigCaseSensitivity:
     """Test case sensitivity handling."""
 
-    def test_section_names_case_sensitive(self):
+    def test_section_names_case_sensitive(self, config):
         """Test that section names are case-sensitive."""
-        config = TalkSmithConfig()
-
         config.set("Test", "key", "value1")
         config.set("test", "key", "value2")
 
@@ -322,19 +314,17 @@ class TestConfigCaseSensitivity:
         # Both should be retrievable
         assert val1 in ["value1", "value2"]
 
-    def test_env_var_case_handling(self, monkeypatch):
+    def test_env_var_case_handling(self, default_config, monkeypatch):
         """Test environment variable case handling."""
-        config = TalkSmithConfig()
-
         # Set env var with specific case
         monkeypatch.setenv("TALKSMITH_MODELS_WHISPER_MODEL", "tiny")
 
         # Should match uppercase
-        result = config.get("Models", "whisper_model")
+        result = default_config.get("Models", "whisper_model")
         assert result == "tiny"
 
         # Mixed case section/key should still work
-        result = config.get("models", "WHISPER_MODEL")
+        result = default_config.get("models", "WHISPER_MODEL")
         # Should still resolve to the env var
         assert result == "tiny"
 
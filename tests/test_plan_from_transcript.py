@@ -16,13 +16,35 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pipeline.plan_from_transcript import PLAN_TEMPLATE, PlanGenerator
 
+try:
+    import orjson
 
+    dumps_bytes = orjson.dumps
+except ImportError:
+
+    def dumps_bytes(obj):
+        return json.dumps(obj).encode("utf-8")
+
+
+# Section headings every rendered plan must contain
+PLAN_SECTIONS = (
+    "## Problem Statement",
+    "## Target Users",
+    "## Goals & Objectives",
+    "## Acceptance Criteria",
+    "## Risks & Assumptions",
+    "## Additional Notes",
+)
+
+
+@pytest.mark.llm_mock
+@pytest.mark.xdist_group("plan_generator")
 class TestPlanGenerator:
     """Test PlanGenerator class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_segments(self):
-        """Sample transcript segments for testing."""
+        """Sample transcript segments for testing, shared read-only across the module."""
         return [
             {
                 "text": "We have a problem with user authentication",
@@ -41,14 +63,33 @@ class TestPlanGenerator:
             },
         ]
 
-    @pytest.fixture
-    def sample_segments_file(self, tmp_path, sample_segments):
-        """Create a temporary segments JSON file."""
-        file_path = tmp_path / "segments.json"
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(sample_segments, f)
+    @pytest.fixture(scope="module")
+    def sample_segments_file(self, tmp_path_factory, sample_segments):
+        """Create a temporary segments JSON file, written once per module."""
+        file_path = tmp_path_factory.mktemp("plan") / "segments.json"
+        file_path.write_bytes(dumps_bytes(sample_segments))
         return file_path
 
+    @pytest.fixture(scope="module")
+    def generator(self):
+        """PlanGenerator with a mocked Anthropic client, for tests that never call the LLM."""
+        with patch("pipeline.plan_from_transcript.anthropic"):
+            return PlanGenerator(model_type="claude")
+
+    @pytest.fixture
+    def anthropic_stub(self, monkeypatch):
+        """Stand-in for the ``anthropic`` module; set ``.Anthropic.return_value`` per test."""
+        stub = MagicMock()
+        monkeypatch.setattr("pipeline.plan_from_transcript.anthropic", stub)
+        return stub
+
+    @pytest.fixture
+    def openai_stub(self, monkeypatch):
+        """Stand-in for the ``openai`` module; set ``.OpenAI.return_value`` per test."""
+        stub = MagicMock()
+        monkeypatch.setattr("pipeline.plan_from_transcript.openai", stub)
+        return stub
+
     @pytest.fixture
     def mock_llm_response(self):
         """Mock LLM response with structured plan data."""
@@ -61,92 +102,79 @@ class TestPlanGenerator:
             "notes": "Implementation requires careful testing of authentication flow.",
         }
 
-    @patch("pipeline.plan_from_transcript.anthropic")
-    def test_init_claude(self, mock_anthropic):
+    def test_init_claude(self, anthropic_stub):
         """Test PlanGenerator initialization with Claude."""
         mock_client = Mock()
-        mock_anthropic.Anthropic.return_value = mock_client
+        anthropic_stub.Anthropic.return_value = mock_client
 
         generator = PlanGenerator(model_type="claude")
 
         assert generator.model_type == "claude"
         assert generator.client == mock_client
         assert generator.model == "claude-3-5-sonnet-20241022"
-        mock_anthropic.Anthropic.assert_called_once()
+        anthropic_stub.Anthropic.assert_called_once()
 
-    @patch("pipeline.plan_from_transcript.openai")
-    def test_init_gpt(self, mock_openai):
+    def test_init_gpt(self, openai_stub):
         """Test PlanGenerator initialization with GPT."""
         mock_client = Mock()
-        mock_openai.OpenAI.return_value = mock_client
+        openai_stub.OpenAI.return_value = mock_client
 
         generator = PlanGenerator(model_type="gpt")
 
         assert generator.model_type == "gpt"
         assert generator.client == mock_client
         assert generator.model == "gpt-4o"
-        mock_openai.OpenAI.assert_called_once()
+        openai_stub.OpenAI.assert_called_once()
 
     def test_init_invalid_model(self):
         """Test PlanGenerator initialization with invalid model type."""
         with pytest.raises(ValueError, match="Unsupported model_type"):
             PlanGenerator(model_type="invalid")
 
-    @patch("pipeline.plan_from_transcript.ANTHROPIC_AVAILABLE", False)
-    def test_init_claude_not_available(self):
+    def test_init_claude_not_available(self, monkeypatch):
         """Test error when Claude package not installed."""
+        monkeypatch.setattr("pipeline.plan_from_transcript.ANTHROPIC_AVAILABLE", False)
         with pytest.raises(ImportError, match="anthropic package not installed"):
             PlanGenerator(model_type="claude")
 
-    def test_load_segments_list(self, sample_segments_file, sample_segments):
+    def test_load_segments_list(self, generator, sample_segments_file, sample_segments):
         """Test loading segments from JSON array."""
-        with patch("pipeline.plan_from_transcript.anthropic"):
-            generator = PlanGenerator(model_type="claude")
-            loaded = generator.load_segments(sample_segments_file)
-            assert loaded == sample_segments
+        loaded = generator.load_segments(sample_segments_file)
+        assert loaded == sample_segments
 
-    def test_load_segments_object(self, tmp_path, sample_segments):
+    def test_load_segments_object(self, generator, tmp_path, sample_segments):
         """Test loading segments from JSON object with 'segments' key."""
         data = {"segments": sample_segments, "metadata": {"duration": 120}}
         file_path = tmp_path / "segments.json"
-        with open(file_path, "w") as f:
-            json.dump(data, f)
+        file_path.write_bytes(dumps_bytes(data))
 
-        with patch("pipeline.plan_from_transcript.anthropic"):
-            generator = PlanGenerator(model_type="claude")
-            loaded = generator.load_segments(file_path)
-            assert loaded == sample_segments
+        loaded = generator.load_segments(file_path)
+        assert loaded == sample_segments
 
-    def test_load_segments_invalid_format(self, tmp_path):
+    def test_load_segments_invalid_format(self, generator, tmp_path):
         """Test error handling for invalid segment format."""
         file_path = tmp_path / "invalid.json"
-        with open(file_path, "w") as f:
-            json.dump({"data": "wrong format"}, f)
+        file_path.write_bytes(dumps_bytes({"data": "wrong format"}))
 
-        with patch("pipeline.plan_from_transcript.anthropic"):
-            generator = PlanGenerator(model_type="claude")
-            with pytest.raises(ValueError, match="Invalid segments format"):
-                generator.load_segments(file_path)
+        with pytest.raises(ValueError, match="Invalid segments format"):
+            generator.load_segments(file_path)
 
-    def test_segments_to_text(self, sample_segments):
+    def test_segments_to_text(self, generator, sample_segments):
         """Test converting segments to plain text transcript."""
-        with patch("pipeline.plan_from_transcript.anthropic"):
-            generator = PlanGenerator(model_type="claude")
-            text = generator.segments_to_text(sample_segments)
+        text = generator.segments_to_text(sample_segments)
 
-            assert "[00:15] Alice: We have a problem with user authentication" in text
-            assert "[01:30] Bob: Our main users are developers and product managers" in text
-            assert "[02:45] Alice: The goal is to reduce login time by 50%" in text
+        assert "[00:15] Alice: We have a problem with user authentication" in text
+        assert "[01:30] Bob: Our main users are developers and product managers" in text
+        assert "[02:45] Alice: The goal is to reduce login time by 50%" in text
 
-    @patch("pipeline.plan_from_transcript.anthropic")
-    def test_extract_plan_data_claude(self, mock_anthropic, mock_llm_response):
+    def test_extract_plan_data_claude(self, anthropic_stub, mock_llm_response):
         """Test extracting plan data using Claude."""
         # Mock Claude API response
         mock_client = Mock()
         mock_response = Mock()
         mock_response.content = [Mock(text=json.dumps(mock_llm_response))]
         mock_client.messages.create.return_value = mock_response
-        mock_anthropic.Anthropic.return_value = mock_client
+        anthropic_stub.Anthropic.return_value = mock_client
 
         generator = PlanGenerator(model_type="claude")
         result = generator.extract_plan_data("Sample transcript")
@@ -156,15 +184,14 @@ class TestPlanGenerator:
         assert result["goals"] == mock_llm_response["goals"]
         mock_client.messages.create.assert_called_once()
 
-    @patch("pipeline.plan_from_transcript.openai")
-    def test_extract_plan_data_gpt(self, mock_openai, mock_llm_response):
+    def test_extract_plan_data_gpt(self, openai_stub, mock_llm_response):
         """Test extracting plan data using GPT."""
         # Mock OpenAI API response
         mock_client = Mock()
         mock_response = Mock()
         mock_response.choices = [Mock(message=Mock(content=json.dumps(mock_llm_response)))]
         mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.OpenAI.return_value = mock_client
+        openai_stub.OpenAI.return_value = mock_client
 
         generator = PlanGenerator(model_type="gpt")
         result = generator.extract_plan_data("Sample transcript")
@@ -173,15 +200,14 @@ class TestPlanGenerator:
         assert result["users"] == mock_llm_response["users"]
         mock_client.chat.completions.create.assert_called_once()
 
-    @patch("pipeline.plan_from_transcript.anthropic")
-    def test_generate_plan(self, mock_anthropic, sample_segments_file, mock_llm_response, tmp_path):
+    def test_generate_plan(self, anthropic_stub, sample_segments_file, mock_llm_response, tmp_path):
         """Test complete plan generation workflow."""
         # Mock Claude API
         mock_client = Mock()
         mock_response = Mock()
         mock_response.content = [Mock(text=json.dumps(mock_llm_response))]
         mock_client.messages.create.return_value = mock_response
-        mock_anthropic.Anthropic.return_value = mock_client
+        anthropic_stub.Anthropic.return_value = mock_client
 
         output_path = tmp_path / "plan.md"
         generator = PlanGenerator(model_type="claude")
@@ -191,16 +217,19 @@ class TestPlanGenerator:
             title="Test Project Plan",
         )
 
-        # Check plan structure
-        assert "# Test Project Plan" in plan_md
-        assert "## Problem Statement" in plan_md
-        assert "## Target Users" in plan_md
-        assert mock_llm_response["problem"] in plan_md
-        assert mock_llm_response["users"] in plan_md
+        # Check plan structure; report every missing piece at once
+        expected = (
+            "# Test Project Plan",
+            *PLAN_SECTIONS,
+            mock_llm_response["problem"],
+            mock_llm_response["users"],
+        )
+        missing = [part for part in expected if part not in plan_md]
+        assert not missing, missing
 
         # Check file was saved
         assert output_path.exists()
-        assert output_path.read_text() == plan_md
+        assert output_path.read_text(encoding="utf-8") == plan_md
 
 
 class TestPlanTemplate:
@@ -208,13 +237,8 @@ class TestPlanTemplate:
 
     def test_plan_template_has_required_sections(self):
         """Test that PLAN_TEMPLATE includes all required sections."""
-        assert "# {title}" in PLAN_TEMPLATE
-        assert "## Problem Statement" in PLAN_TEMPLATE
-        assert "## Target Users" in PLAN_TEMPLATE
-        assert "## Goals & Objectives" in PLAN_TEMPLATE
-        assert "## Acceptance Criteria" in PLAN_TEMPLATE
-        assert "## Risks & Assumptions" in PLAN_TEMPLATE
-        assert "## Additional Notes" in PLAN_TEMPLATE
+        missing = [part for part in ("# {title}", *PLAN_SECTIONS) if part not in PLAN_TEMPLATE]
+        assert not missing, missing
 
     def test_plan_template_formatting(self):
         """Test that plan template can be formatted correctly."""
@@ -1,7 +1,8 @@
 """Unit tests for FFmpeg verification script."""
 
 import subprocess
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
@@ -16,6 +17,15 @@ from scripts.check_ffmpeg import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_check_caches():
+    """Forget cached probe results so each test's shutil.which/subprocess patch takes effect."""
+    check_ffmpeg_installed.cache_clear()
+    check_ffprobe_installed.cache_clear()
+    get_ffmpeg_version.cache_clear()
+    check_ffmpeg_codecs.cache_clear()
+
+
 class TestCheckFFmpegInstalled:
     """Test FFmpeg installation detection."""
 
@@ -29,6 +39,14 @@ class TestCheckFFmpegInstalled:
         with patch("shutil.which", return_value=None):
             assert check_ffmpeg_installed() is False
 
+    def test_ffmpeg_path_lookup_cached(self):
+        """Test that PATH is only searched on the first call."""
+        with patch("shutil.which", return_value="/usr/bin/ffmpeg") as mock_which:
+            assert check_ffmpeg_installed() is True
+            assert check_ffmpeg_installed() is True
+
+        assert mock_which.call_count == 1
+
 
 class TestGetFFmpegVersion:
     """Test FFmpeg version detection."""
@@ -133,6 +151,21 @@ class TestCheckFFmpegCodecs:
             assert has_pcm is True
             assert has_aac is True
 
+    def test_codecs_only_matched_as_codec_names(self):
+        """Test that codec names inside other names or descriptions don't count."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = """Codecs:
+ D.A.L. aac_latm        AAC LATM (Advanced Audio Coding LATM syntax)
+ DEA.L. mp3             MP3 (encoders: libmp3lame libfdk_aac pcm_s16le_wrapper)
+"""
+
+        with patch("subprocess.run", return_value=mock_result):
+            has_pcm, has_aac = check_ffmpeg_codecs()
+
+            assert has_pcm is False
+            assert has_aac is False
+
     def test_codecs_check_error(self):
         """Test when codec check fails."""
         with patch("subprocess.run", side_effect=FileNotFoundError()):
@@ -205,137 +238,61 @@ class TestPrintFunctions:
 class TestMain:
     """Test main function execution."""
 
-    @patch("scripts.check_ffmpeg.check_ffmpeg_codecs")
-    @patch("scripts.check_ffmpeg.check_ffprobe_installed")
-    @patch("scripts.check_ffmpeg.get_ffmpeg_version")
-    @patch("scripts.check_ffmpeg.check_ffmpeg_installed")
-    def test_main_all_checks_pass(self, mock_installed, mock_version, mock_ffprobe, mock_codecs):
-        """Test main when all checks pass."""
-        mock_installed.return_value = True
-        mock_version.return_value = "ffmpeg version 4.4.2"
-        mock_ffprobe.return_value = True
-        mock_codecs.return_value = (True, True)  # Both PCM and AAC available
-
-        # Mock the functionality test
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-
-        with patch("subprocess.run", return_value=mock_result):
-            exit_code = main()
-
-            assert exit_code == 0
-
-    @patch("scripts.check_ffmpeg.check_ffmpeg_installed")
-    def test_main_ffmpeg_not_installed(self, mock_installed):
-        """Test main when FFmpeg is not installed."""
-        mock_installed.return_value = False
-
-        exit_code = main()
-
-        assert exit_code == 1
-
-    @patch("scripts.check_ffmpeg.check_ffmpeg_codecs")
-    @patch("scripts.check_ffmpeg.check_ffprobe_installed")
-    @patch("scripts.check_ffmpeg.get_ffmpeg_version")
-    @patch("scripts.check_ffmpeg.check_ffmpeg_installed")
-    def test_main_ffprobe_missing(self, mock_installed, mock_version, mock_ffprobe, mock_codecs):
-        """Test main when ffprobe is missing."""
-        mock_installed.return_value = True
-        mock_version.return_value = "ffmpeg version 4.4.2"
-        mock_ffprobe.return_value = False
-        mock_codecs.return_value = (True, True)
-
-        # Mock the functionality test
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-
-        with patch("subprocess.run", return_value=mock_result):
-            exit_code = main()
-
-            assert exit_code == 1
-
-    @patch("scripts.check_ffmpeg.check_ffmpeg_codecs")
-    @patch("scripts.check_ffmpeg.check_ffprobe_installed")
-    @patch("scripts.check_ffmpeg.get_ffmpeg_version")
-    @patch("scripts.check_ffmpeg.check_ffmpeg_installed")
-    def test_main_missing_codecs(self, mock_installed, mock_version, mock_ffprobe, mock_codecs):
-        """Test main when essential codecs are missing."""
-        mock_installed.return_value = True
-        mock_version.return_value = "ffmpeg version 4.4.2"
-        mock_ffprobe.return_value = True
-        mock_codecs.return_value = (False, True)  # PCM missing
-
-        # Mock the functionality test
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-
-        with patch("subprocess.run", return_value=mock_result):
-            exit_code = main()
-
-            assert exit_code == 1
-
-    @patch("scripts.check_ffmpeg.check_ffmpeg_codecs")
-    @patch("scripts.check_ffmpeg.check_ffprobe_installed")
-    @patch("scripts.check_ffmpeg.get_ffmpeg_version")
-    @patch("scripts.check_ffmpeg.check_ffmpeg_installed")
-    def test_main_functionality_test_fails(
-        self, mock_installed, mock_version, mock_ffprobe, mock_codecs
-    ):
-        """Test main when functionality test fails."""
-        mock_installed.return_value = True
-        mock_version.return_value = "ffmpeg version 4.4.2"
-        mock_ffprobe.return_value = True
-        mock_codecs.return_value = (True, True)
-
-        # Mock the functionality test to fail
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-
-        with patch("subprocess.run", return_value=mock_result):
-            exit_code = main()
-
-            assert exit_code == 1
-
-    @patch("scripts.check_ffmpeg.check_ffmpeg_codecs")
-    @patch("scripts.check_ffmpeg.check_ffprobe_installed")
-    @patch("scripts.check_ffmpeg.get_ffmpeg_version")
-    @patch("scripts.check_ffmpeg.check_ffmpeg_installed")
-    def test_main_functionality_test_exception(
-        self, mock_installed, mock_version, mock_ffprobe, mock_codecs
-    ):
-        """Test main when functionality test raises exception."""
-        mock_installed.return_value = True
-        mock_version.return_value = "ffmpeg version 4.4.2"
-        mock_ffprobe.return_value = True
-        mock_codecs.return_value = (True, True)
-
-        # Mock the functionality test to raise exception
-        with patch("subprocess.run", side_effect=Exception("Test error")):
-            exit_code = main()
-
-            assert exit_code == 1
-
-    @patch("scripts.check_ffmpeg.check_ffmpeg_codecs")
-    @patch("scripts.check_ffmpeg.check_ffprobe_installed")
-    @patch("scripts.check_ffmpeg.get_ffmpeg_version")
-    @patch("scripts.check_ffmpeg.check_ffmpeg_installed")
-    def test_main_partial_codec_support(
-        self, mock_installed, mock_version, mock_ffprobe, mock_codecs
-    ):
-        """Test main when only some codecs are available."""
-        mock_installed.return_value = True
-        mock_version.return_value = "ffmpeg version 4.4.2"
-        mock_ffprobe.return_value = True
-        mock_codecs.return_value = (True, False)  # PCM available, AAC missing
-
-        # Mock the functionality test
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-
-        with patch("subprocess.run", return_value=mock_result):
-            exit_code = main()
-
-            assert exit_code == 1
+    @pytest.fixture
+    def happy_path_mocks(self):
+        """Patch main()'s probes to report a complete FFmpeg install; tests override values."""
+        with patch.multiple(
+            "scripts.check_ffmpeg",
+            check_ffmpeg_installed=DEFAULT,
+            get_ffmpeg_version=DEFAULT,
+            check_ffprobe_installed=DEFAULT,
+            check_ffmpeg_codecs=DEFAULT,
+        ) as mocks:
+            mocks["check_ffmpeg_installed"].return_value = True
+            mocks["get_ffmpeg_version"].return_value = "ffmpeg version 4.4.2"
+            mocks["check_ffprobe_installed"].return_value = True
+            mocks["check_ffmpeg_codecs"].return_value = (True, True)
+            yield SimpleNamespace(
+                installed=mocks["check_ffmpeg_installed"],
+                version=mocks["get_ffmpeg_version"],
+                ffprobe=mocks["check_ffprobe_installed"],
+                codecs=mocks["check_ffmpeg_codecs"],
+            )
+
+    @pytest.mark.parametrize(
+        "installed,ffprobe,codecs,functionality,expected",
+        [
+            (True, True, (True, True), 0, 0),
+            (False, True, (True, True), 0, 1),
+            (True, False, (True, True), 0, 1),
+            (True, True, (False, True), 0, 1),  # PCM missing
+            (True, True, (True, False), 0, 1),  # AAC missing
+            (True, True, (True, True), 1, 1),
+            (True, True, (True, True), Exception("Test error"), 1),
+        ],
+        ids=[
+            "all-checks-pass",
+            "ffmpeg-not-installed",
+            "ffprobe-missing",
+            "missing-codecs",
+            "partial-codec-support",
+            "functionality-test-fails",
+            "functionality-test-exception",
+        ],
+    )
+    def test_main(self, happy_path_mocks, installed, ffprobe, codecs, functionality, expected):
+        """Test main's exit code; functionality is the sine test's return code or exception."""
+        happy_path_mocks.installed.return_value = installed
+        happy_path_mocks.ffprobe.return_value = ffprobe
+        happy_path_mocks.codecs.return_value = codecs
+
+        if isinstance(functionality, Exception):
+            run = patch("subprocess.run", side_effect=functionality)
+        else:
+            run = patch("subprocess.run", return_value=MagicMock(returncode=functionality))
+
+        with run:
+            assert main() == expected
 
 
 class TestIntegration:
@@ -352,6 +309,8 @@ class TestIntegration:
 
             # Test when both are installed
             mock_which.return_value = "/usr/bin/ffmpeg"
+            check_ffmpeg_installed.cache_clear()
+            check_ffprobe_installed.cache_clear()
 
             assert check_ffmpeg_installed() is True
             assert check_ffprobe_installed() is True
@@ -369,6 +328,7 @@ class TestIntegration:
             mock_result.returncode = 0
             mock_result.stdout = version_string + "\nMore output..."
 
+            get_ffmpeg_version.cache_clear()
             with patch("subprocess.run", return_value=mock_result):
                 result = get_ffmpeg_version()
 
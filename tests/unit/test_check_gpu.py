@@ -1,7 +1,9 @@
 """Unit tests for GPU verification script."""
 
 import subprocess
-from unittest.mock import MagicMock, patch
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
 import pytest
 
@@ -15,6 +17,36 @@ from scripts.check_gpu import (
 )
 
 
+@pytest.fixture
+def fake_torch(monkeypatch):
+    """Install a lightweight stand-in ``torch`` module: version 2.0.0, CUDA 11.8, no GPUs.
+
+    Tests flip ``cuda.is_available``/``cuda.device_count`` and set device properties.
+    """
+    torch = ModuleType("torch")
+    torch.__version__ = "2.0.0"
+    torch.version = SimpleNamespace(cuda="11.8")
+    torch.cuda = SimpleNamespace(
+        is_available=Mock(return_value=False),
+        device_count=Mock(return_value=0),
+        get_device_properties=Mock(),
+        empty_cache=Mock(),
+    )
+    torch.backends = SimpleNamespace(
+        cudnn=SimpleNamespace(is_available=Mock(return_value=True), version=Mock(return_value=8902))
+    )
+    torch.randn = Mock()
+    torch.matmul = Mock()
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    return torch
+
+
+@pytest.fixture(autouse=True)
+def _clear_driver_cache():
+    """Forget the cached nvidia-smi result so each test's subprocess patch takes effect."""
+    check_nvidia_driver.cache_clear()
+
+
 class TestGetSystemInfo:
     """Test system information gathering."""
 
@@ -39,101 +71,57 @@ class TestGetSystemInfo:
 class TestCheckCudaAvailability:
     """Test CUDA availability checking."""
 
-    def test_cuda_available_with_devices(self):
+    def test_cuda_available_with_devices(self, fake_torch):
         """Test CUDA detection when available with devices."""
-        with patch.dict("sys.modules", {"torch": MagicMock()}):
-            import sys
-
-            mock_torch = sys.modules["torch"]
-
-            mock_torch.__version__ = "2.0.0"
-            mock_torch.cuda.is_available.return_value = True
-            mock_torch.version.cuda = "11.8"
-            mock_torch.cuda.device_count.return_value = 1
-
-            # Mock device properties
-            mock_props = MagicMock()
-            mock_props.name = "NVIDIA GeForce RTX 3090"
-            mock_props.total_memory = 24 * 1024**3  # 24 GB
-            mock_props.major = 8
-            mock_props.minor = 6
-            mock_torch.cuda.get_device_properties.return_value = mock_props
-
-            result = check_cuda_availability()
-
-            assert result["cuda_available"] is True
-            assert result["cuda_version"] == "11.8"
-            assert result["device_count"] == 1
-            assert len(result["devices"]) == 1
-            assert result["devices"][0]["name"] == "NVIDIA GeForce RTX 3090"
-            assert result["devices"][0]["total_memory_gb"] == 24.0
-
-    def test_cuda_not_available(self):
+        fake_torch.cuda.is_available.return_value = True
+        fake_torch.cuda.device_count.return_value = 1
+        fake_torch.cuda.get_device_properties.return_value = SimpleNamespace(
+            name="NVIDIA GeForce RTX 3090",
+            total_memory=24 * 1024**3,  # 24 GB
+            major=8,
+            minor=6,
+        )
+
+        result = check_cuda_availability()
+
+        assert result["cuda_available"] is True
+        assert result["cuda_version"] == "11.8"
+        assert result["device_count"] == 1
+        assert len(result["devices"]) == 1
+        assert result["devices"][0]["name"] == "NVIDIA GeForce RTX 3090"
+        assert result["devices"][0]["total_memory_gb"] == 24.0
+
+    def test_cuda_not_available(self, fake_torch):
         """Test CUDA detection when not available."""
-        with patch.dict("sys.modules", {"torch": MagicMock()}):
-            import sys
-
-            mock_torch = sys.modules["torch"]
-
-            mock_torch.__version__ = "2.0.0"
-            mock_torch.cuda.is_available.return_value = False
-            mock_torch.cuda.device_count.return_value = 0
-
-            result = check_cuda_availability()
+        result = check_cuda_availability()
 
-            assert result["cuda_available"] is False
-            assert result["cuda_version"] is None
-            assert result["device_count"] == 0
-            assert result["devices"] == []
+        assert result["cuda_available"] is False
+        assert result["cuda_version"] is None
+        assert result["device_count"] == 0
+        assert result["devices"] == []
 
-    def test_cuda_check_without_torch_installed(self):
+    def test_cuda_check_without_torch_installed(self, monkeypatch):
         """Test CUDA check when PyTorch is not installed."""
-        with patch.dict("sys.modules", {"torch": None}):
-            # Force import error
-            with patch(
-                "builtins.__import__",
-                side_effect=ImportError("No module named 'torch'"),
-            ):
-                result = check_cuda_availability()
-
-                assert result["cuda_available"] is False
-                assert "error" in result
-                assert "PyTorch not installed" in result["error"]
-
-    def test_cuda_check_with_multiple_gpus(self):
-        """Test CUDA detection with multiple GPUs."""
-        with patch.dict("sys.modules", {"torch": MagicMock()}):
-            import sys
-
-            mock_torch = sys.modules["torch"]
+        # A None entry in sys.modules makes "import torch" raise ImportError
+        monkeypatch.setitem(sys.modules, "torch", None)
 
-            mock_torch.__version__ = "2.0.0"
-            mock_torch.cuda.is_available.return_value = True
-            mock_torch.version.cuda = "11.8"
-            mock_torch.cuda.device_count.return_value = 2
+        result = check_cuda_availability()
 
-            # Mock device properties for two GPUs
-            mock_props_1 = MagicMock()
-            mock_props_1.name = "NVIDIA A100"
-            mock_props_1.total_memory = 40 * 1024**3
-            mock_props_1.major = 8
-            mock_props_1.minor = 0
+        assert result["cuda_available"] is False
+        assert "error" in result
+        assert "PyTorch not installed" in result["error"]
 
-            mock_props_2 = MagicMock()
-            mock_props_2.name = "NVIDIA A100"
-            mock_props_2.total_memory = 40 * 1024**3
-            mock_props_2.major = 8
-            mock_props_2.minor = 0
-
-            mock_torch.cuda.get_device_properties.side_effect = [
-                mock_props_1,
-                mock_props_2,
-            ]
+    def test_cuda_check_with_multiple_gpus(self, fake_torch):
+        """Test CUDA detection with multiple GPUs."""
+        fake_torch.cuda.is_available.return_value = True
+        fake_torch.cuda.device_count.return_value = 2
+        a100 = SimpleNamespace(name="NVIDIA A100", total_memory=40 * 1024**3, major=8, minor=0)
+        fake_torch.cuda.get_device_properties.side_effect = [a100, a100]
 
-            result = check_cuda_availability()
+        result = check_cuda_availability()
 
-            assert result["device_count"] == 2
-            assert len(result["devices"]) == 2
+        assert result["device_count"] == 2
+        assert len(result["devices"]) == 2
 
 
 class TestCheckNvidiaDriver:
@@ -176,6 +164,18 @@ class TestCheckNvidiaDriver:
             # Should return first version
             assert version == "535.104.05"
 
+    def test_nvidia_driver_queried_once(self):
+        """Test that nvidia-smi is only run on the first call."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "535.104.05\n"
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            assert check_nvidia_driver() == "535.104.05"
+            assert check_nvidia_driver() == "535.104.05"
+
+        assert mock_run.call_count == 1
+
 
 class TestPrintFunctions:
     """Test print utility functions."""
@@ -215,197 +215,85 @@ class TestPrintFunctions:
         assert "✗" in captured.out
 
 
+def _cuda_info(device_count: int) -> dict:
+    """check_cuda_availability() result for a working CUDA setup with ``device_count`` GPUs."""
+    return {
+        "torch_version": "2.0.0",
+        "cuda_available": True,
+        "cuda_version": "11.8",
+        "cudnn_available": True,
+        "cudnn_version": 8902,
+        "device_count": device_count,
+        "devices": [
+            {
+                "id": i,
+                "name": f"GPU{i}",
+                "total_memory_gb": 24.0,
+                "compute_capability": "8.6",
+            }
+            for i in range(device_count)
+        ],
+    }
+
+
+NO_CUDA_INFO = {
+    "torch_version": "2.0.0",
+    "cuda_available": False,
+    "cuda_version": None,
+    "device_count": 0,
+    "devices": [],
+}
+
+NO_TORCH_INFO = {**NO_CUDA_INFO, "torch_version": None, "error": "PyTorch not installed"}
+
+
 class TestMain:
     """Test main function execution."""
 
-    @patch("scripts.check_gpu.check_nvidia_driver")
-    @patch("scripts.check_gpu.check_cuda_availability")
-    @patch("scripts.check_gpu.get_system_info")
-    def test_main_all_checks_pass(self, mock_sys_info, mock_cuda, mock_driver):
-        """Test main function when all checks pass."""
-        # Mock system info
-        mock_sys_info.return_value = {
-            "platform": "Linux",
-            "platform_release": "5.15.0",
-            "architecture": "x86_64",
-            "python_version": "3.10.0",
-        }
-
-        # Mock driver check
-        mock_driver.return_value = "535.104.05"
-
-        # Mock CUDA check
-        mock_props = MagicMock()
-        mock_props.name = "NVIDIA RTX 3090"
-        mock_props.total_memory = 24 * 1024**3
-        mock_props.major = 8
-        mock_props.minor = 6
-
-        mock_cuda.return_value = {
-            "torch_version": "2.0.0",
-            "cuda_available": True,
-            "cuda_version": "11.8",
-            "cudnn_available": True,
-            "cudnn_version": 8902,
-            "device_count": 1,
-            "devices": [
-                {
-                    "id": 0,
-                    "name": "NVIDIA RTX 3090",
-                    "total_memory_gb": 24.0,
-                    "compute_capability": "8.6",
-                }
-            ],
-        }
-
-        # Mock the GPU test
-        with patch.dict("sys.modules", {"torch": MagicMock()}):
-            import sys
-
-            mock_torch = sys.modules["torch"]
-            mock_tensor = MagicMock()
-            mock_torch.randn.return_value.cuda.return_value = mock_tensor
-            mock_torch.matmul.return_value = mock_tensor
-
-            exit_code = main()
-
-            assert exit_code == 0
-
-    @patch("scripts.check_gpu.check_nvidia_driver")
-    @patch("scripts.check_gpu.check_cuda_availability")
-    @patch("scripts.check_gpu.get_system_info")
-    def test_main_no_cuda_available(self, mock_sys_info, mock_cuda, mock_driver):
-        """Test main function when CUDA is not available."""
-        mock_sys_info.return_value = {
-            "platform": "Linux",
-            "platform_release": "5.15.0",
-            "architecture": "x86_64",
-            "python_version": "3.10.0",
-        }
-
-        mock_driver.return_value = None
-
-        mock_cuda.return_value = {
-            "torch_version": "2.0.0",
-            "cuda_available": False,
-            "cuda_version": None,
-            "device_count": 0,
-            "devices": [],
-        }
-
-        exit_code = main()
-
-        assert exit_code == 1
-
-    @patch("scripts.check_gpu.check_nvidia_driver")
-    @patch("scripts.check_gpu.check_cuda_availability")
-    @patch("scripts.check_gpu.get_system_info")
-    def test_main_pytorch_not_installed(self, mock_sys_info, mock_cuda, mock_driver):
-        """Test main function when PyTorch is not installed."""
-        mock_sys_info.return_value = {
-            "platform": "Linux",
-            "platform_release": "5.15.0",
-            "architecture": "x86_64",
-            "python_version": "3.10.0",
-        }
-
-        mock_driver.return_value = "535.104.05"
-
-        mock_cuda.return_value = {
-            "torch_version": None,
-            "cuda_available": False,
-            "cuda_version": None,
-            "device_count": 0,
-            "devices": [],
-            "error": "PyTorch not installed",
-        }
-
-        exit_code = main()
-
-        assert exit_code == 1
-
-    @patch("scripts.check_gpu.check_nvidia_driver")
-    @patch("scripts.check_gpu.check_cuda_availability")
-    @patch("scripts.check_gpu.get_system_info")
-    def test_main_multi_gpu_setup(self, mock_sys_info, mock_cuda, mock_driver):
-        """Test main function with multi-GPU setup."""
-        mock_sys_info.return_value = {
-            "platform": "Linux",
-            "platform_release": "5.15.0",
-            "architecture": "x86_64",
-            "python_version": "3.10.0",
-        }
-
-        mock_driver.return_value = "535.104.05"
-
-        mock_cuda.return_value = {
-            "torch_version": "2.0.0",
-            "cuda_available": True,
-            "cuda_version": "11.8",
-            "cudnn_available": True,
-            "cudnn_version": 8902,
-            "device_count": 4,
-            "devices": [
-                {
-                    "id": i,
-                    "name": f"GPU{i}",
-                    "total_memory_gb": 40.0,
-                    "compute_capability": "8.0",
-                }
-                for i in range(4)
-            ],
-        }
-
-        with patch.dict("sys.modules", {"torch": MagicMock()}):
-            import sys
-
-            mock_torch = sys.modules["torch"]
-            mock_tensor = MagicMock()
-            mock_torch.randn.return_value.cuda.return_value = mock_tensor
-            mock_torch.matmul.return_value = mock_tensor
-
-            exit_code = main()
-
-            assert exit_code == 0
-
-    @patch("scripts.check_gpu.check_nvidia_driver")
-    @patch("scripts.check_gpu.check_cuda_availability")
-    @patch("scripts.check_gpu.get_system_info")
-    def test_main_gpu_test_failure(self, mock_sys_info, mock_cuda, mock_driver):
-        """Test main function when GPU test fails."""
-        mock_sys_info.return_value = {
-            "platform": "Linux",
-            "platform_release": "5.15.0",
-            "architecture": "x86_64",
-            "python_version": "3.10.0",
-        }
-
-        mock_driver.return_value = "535.104.05"
-
-        mock_cuda.return_value = {
-            "torch_version": "2.0.0",
-            "cuda_available": True,
-            "cuda_version": "11.8",
-            "cudnn_available": True,
-            "cudnn_version": 8902,
-            "device_count": 1,
-            "devices": [
-                {
-                    "id": 0,
-                    "name": "NVIDIA RTX 3090",
-                    "total_memory_gb": 24.0,
-                    "compute_capability": "8.6",
-                }
-            ],
-        }
-
-        # Mock GPU test failure
-        with patch.dict("sys.modules", {"torch": MagicMock()}):
-            import sys
-
-            mock_torch = sys.modules["torch"]
-            mock_torch.randn.return_value.cuda.side_effect = RuntimeError("CUDA out of memory")
-
-            exit_code = main()
-
-            assert exit_code == 1
+    @pytest.fixture
+    def happy_path_mocks(self):
+        """Patch main()'s probes to report one working GPU on Linux; tests override values."""
+        with patch.multiple(
+            "scripts.check_gpu",
+            get_system_info=DEFAULT,
+            check_cuda_availability=DEFAULT,
+            check_nvidia_driver=DEFAULT,
+        ) as mocks:
+            mocks["get_system_info"].return_value = {
+                "platform": "Linux",
+                "platform_release": "5.15.0",
+                "architecture": "x86_64",
+                "python_version": "3.10.0",
+            }
+            mocks["check_cuda_availability"].return_value = _cuda_info(1)
+            mocks["check_nvidia_driver"].return_value = "535.104.05"
+            yield SimpleNamespace(
+                sys_info=mocks["get_system_info"],
+                cuda=mocks["check_cuda_availability"],
+                driver=mocks["check_nvidia_driver"],
+            )
+
+    @pytest.mark.parametrize(
+        "driver,cuda_info,gpu_test_error,expected",
+        [
+            ("535.104.05", _cuda_info(1), None, 0),
+            (None, NO_CUDA_INFO, None, 1),
+            ("535.104.05", NO_TORCH_INFO, None, 1),
+            ("535.104.05", _cuda_info(4), None, 0),
+            ("535.104.05", _cuda_info(1), RuntimeError("CUDA out of memory"), 1),
+        ],
+        ids=[
+            "all-checks-pass",
+            "no-cuda-available",
+            "pytorch-not-installed",
+            "multi-gpu-setup",
+            "gpu-test-failure",
+        ],
+    )
+    def test_main(self, happy_path_mocks, fake_torch, driver, cuda_info, gpu_test_error, expected):
+        """Test main's exit code for each driver/CUDA/GPU-test outcome."""
+        happy_path_mocks.driver.return_value = driver
+        happy_path_mocks.cuda.return_value = cuda_info
+        fake_torch.randn.return_value.cuda.side_effect = gpu_test_error
+
+        assert main() == expected
@@ -9,12 +9,15 @@ This test suite provides full coverage for pipeline/exporters.py including:
 """
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 from pipeline.exporters import (
     export_all,
+    export_batch,
     export_json,
     export_srt,
     export_txt,
@@ -298,8 +301,7 @@ class TestExportJson:
         """Test JSON export produces valid JSON with correct structure."""
         output_file = temp_dir / "output.json"
         export_json(sample_segments, output_file)
-        with open(output_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_file.read_bytes())
         assert "segments" in data
         assert len(data["segments"]) == 2
         assert data["segments"][0]["start"] == 0.0
@@ -310,16 +312,14 @@ class TestExportJson:
         """Test JSON includes speaker information."""
         output_file = temp_dir / "output.json"
         export_json(sample_segments, output_file)
-        with open(output_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_file.read_bytes())
         assert data["segments"][0]["speaker"] == "SPEAKER_00"
 
     def test_export_json_includes_words(self, sample_segments, temp_dir):
         """Test JSON includes word-level timestamps when available."""
         output_file = temp_dir / "output.json"
         export_json(sample_segments, output_file, include_words=True)
-        with open(output_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_file.read_bytes())
         assert "words" in data["segments"][0]
         assert len(data["segments"][0]["words"]) == 5
         assert data["segments"][0]["words"][0]["word"] == "Hello"
@@ -328,10 +328,23 @@ class TestExportJson:
         """Test JSON excludes word-level data when not requested."""
         output_file = temp_dir / "output.json"
         export_json(sample_segments, output_file, include_words=False)
-        with open(output_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_file.read_bytes())
         assert "words" not in data["segments"][0]
 
+    def test_export_json_keeps_null_speaker_and_words(self, temp_dir):
+        """Test explicit null speaker/words are written as null, absent ones omitted."""
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "Null fields", "speaker": None, "words": None},
+            {"start": 1.0, "end": 2.0, "text": "No fields"},
+        ]
+        output_file = temp_dir / "output.json"
+        export_json(segments, output_file, include_words=True)
+        data = json.loads(output_file.read_bytes())
+        assert data["segments"][0]["speaker"] is None
+        assert data["segments"][0]["words"] is None
+        assert "speaker" not in data["segments"][1]
+        assert "words" not in data["segments"][1]
+
     def test_export_json_pretty_format(self, sample_segments, temp_dir):
         """Test JSON pretty printing with indentation."""
         output_file = temp_dir / "output.json"
@@ -357,6 +370,22 @@ class TestExportJson:
         assert "Hello 世界 🌍" in content
         assert "\\u" not in content  # ensure_ascii=False
 
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_export_json_streamed_output_matches_json_dump(self, sample_segments, temp_dir, pretty):
+        """Test streamed JSON output is byte-identical to a single json.dump."""
+        output_file = temp_dir / "streamed.json"
+        export_json(sample_segments, output_file, pretty=pretty)
+        expected = json.dumps(
+            {"segments": sample_segments}, indent=2 if pretty else None, ensure_ascii=False
+        )
+        assert output_file.read_text(encoding="utf-8") == expected
+
+    def test_export_json_empty_segments(self, temp_dir):
+        """Test JSON export of an empty segment list is still valid JSON."""
+        output_file = temp_dir / "empty.json"
+        export_json([], output_file)
+        assert json.loads(output_file.read_bytes()) == {"segments": []}
+
 
 @pytest.mark.unit
 class TestExportAll:
@@ -397,11 +426,58 @@ class TestExportAll:
         for path in output_files.values():
             assert path.parent == output_dir
 
+    def test_export_all_line_endings(self, sample_segments, temp_dir):
+        """Test every format ends lines with the platform separator, and only with it."""
+        sample_segments[0]["text"] = "Line one\nline two"
+        output_files = export_all(sample_segments, temp_dir, "test")
+        separator = os.linesep.encode("ascii")
+        for fmt, path in output_files.items():
+            raw = path.read_bytes()
+            assert separator in raw, fmt
+            stray = raw.replace(separator, b"")
+            assert b"\n" not in stray and b"\r" not in stray, fmt
+
+    def test_text_exports_translate_newlines(self, sample_segments, temp_dir, monkeypatch):
+        """Test byte-built exports write CRLF where that is the platform separator."""
+        monkeypatch.setattr("pipeline.exporters._LINE_SEPARATOR", b"\r\n")
+        output_files = export_all(sample_segments, temp_dir, "test", formats=["txt", "srt", "vtt"])
+        for fmt, path in output_files.items():
+            raw = path.read_bytes()
+            assert raw.count(b"\n") == raw.count(b"\r\n") > 0, fmt
+
     def test_export_all_invalid_format(self, sample_segments, temp_dir):
         """Test export_all raises error for unknown format."""
         with pytest.raises(ValueError, match="Unknown format: invalid"):
             export_all(sample_segments, temp_dir, "test", formats=["invalid"])
 
+    def test_export_all_invalid_format_writes_nothing(self, sample_segments, temp_dir):
+        """Test export_all rejects unknown formats before writing any file."""
+        with pytest.raises(ValueError, match="Unknown format: invalid"):
+            export_all(sample_segments, temp_dir, "test", formats=["txt", "srt", "invalid"])
+        assert list(temp_dir.iterdir()) == []
+
+    def test_export_all_validates_segments(self, temp_dir):
+        """Test export_all rejects invalid segments before writing any file."""
+        with pytest.raises(ValueError, match="missing 'text'"):
+            export_all([{"start": 0.0, "end": 1.0}], temp_dir, "test")
+        assert list(temp_dir.iterdir()) == []
+
+    def test_export_all_subtitle_timings_match_formatters(self, temp_dir):
+        """Test shared SRT/VTT timing lines in export_all match the timestamp formatters."""
+        times = [0.0, 0.001, 0.999, 1.5, 59.999, 61.25, 3599.5, 3661.123, 7265.5, 86399.999]
+        segments = [{"start": t, "end": t, "text": f"Cue {i}"} for i, t in enumerate(times)]
+        output_files = export_all(segments, temp_dir, "timings", formats=["srt", "vtt", "txt"])
+
+        srt_content = output_files["srt"].read_text(encoding="utf-8")
+        vtt_content = output_files["vtt"].read_text(encoding="utf-8")
+        txt_content = output_files["txt"].read_text(encoding="utf-8")
+        for t in times:
+            srt_ts, vtt_ts = format_timestamp_srt(t), format_timestamp_vtt(t)
+            assert f"{srt_ts} --> {srt_ts}" in srt_content
+            assert f"{vtt_ts} --> {vtt_ts}" in vtt_content
+            assert f"[{vtt_ts} --> {vtt_ts}]" in txt_content
+        assert "," not in vtt_content
+
     def test_export_all_returns_paths(self, sample_segments, temp_dir):
         """Test export_all returns dict mapping formats to file paths."""
         output_files = export_all(sample_segments, temp_dir, "test")
@@ -409,6 +485,38 @@ class TestExportAll:
         assert all(isinstance(p, Path) for p in output_files.values())
 
 
+@pytest.mark.unit
+class TestExportBatch:
+    """Tests for export_batch function."""
+
+    def test_export_batch_returns_results_in_job_order(self, sample_segments, temp_dir):
+        """Test export_batch returns one export_all result per job, in order."""
+        jobs = [(sample_segments, temp_dir / name, name) for name in ("a", "b", "c")]
+        results = export_batch(jobs, formats=["txt", "json"], workers=1)
+        assert [r["txt"] for r in results] == [temp_dir / n / f"{n}.txt" for n in ("a", "b", "c")]
+        for output_files in results:
+            assert set(output_files) == {"txt", "json"}
+            assert all(path.exists() for path in output_files.values())
+
+    def test_export_batch_inline_passes_logger(self, sample_segments, temp_dir):
+        """Test the single-worker path logs each job's export_all call."""
+        logger = MagicMock()
+        jobs = [(sample_segments, temp_dir / name, name) for name in ("a", "b")]
+        export_batch(jobs, formats=["txt"], workers=1, logger=logger)
+        messages = [call.args[0] for call in logger.info.call_args_list]
+        assert messages.count("Exporting to 1 formats") == 2
+
+    def test_export_batch_empty_jobs(self):
+        """Test export_batch with no jobs returns an empty list."""
+        assert export_batch([]) == []
+
+    def test_export_batch_propagates_errors(self, temp_dir):
+        """Test export_batch re-raises a failing job's exception."""
+        jobs = [([{"start": 0.0, "end": 1.0}], temp_dir, "bad")]
+        with pytest.raises(ValueError, match="missing 'text'"):
+            export_batch(jobs, workers=1)
+
+
 @pytest.mark.unit
 class TestEdgeCases:
     """Tests for edge cases and error conditions."""
@@ -429,6 +537,22 @@ class TestEdgeCases:
         content = output_file.read_text(encoding="utf-8")
         assert "Single segment" in content
 
+    def test_unhashable_speaker(self, temp_dir):
+        """Test list and dict speaker values are written rather than raising."""
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "First", "speaker": ["A", "B"]},
+            {"start": 1.0, "end": 2.0, "text": "Second", "speaker": {"id": 1}},
+            {"start": 2.0, "end": 3.0, "text": "Third", "speaker": ["A", "B"]},
+        ]
+        output_file = temp_dir / "unhashable.txt"
+        export_txt(segments, output_file, include_timestamps=False)
+        content = output_file.read_text(encoding="utf-8")
+        assert content.splitlines() == [
+            "['A', 'B']: First",
+            "{'id': 1}: Second",
+            "['A', 'B']: Third",
+        ]
+
     def test_long_duration_timestamp(self, temp_dir):
         """Test timestamp formatting for long durations (multiple hours)."""
         segments = [{"start": 7265.5, "end": 7270.0, "text": "Two hours in"}]  # 2h 1m 5.5s
@@ -437,6 +561,16 @@ class TestEdgeCases:
         content = output_file.read_text(encoding="utf-8")
         assert "02:01:05,500" in content
 
+    def test_timestamp_beyond_99_hours(self, temp_dir):
+        """Test subtitle timestamps keep all hour digits past 99 hours."""
+        segments = [{"start": 360000.25, "end": 360001.5, "text": "Marathon"}]
+        srt_file = temp_dir / "marathon.srt"
+        vtt_file = temp_dir / "marathon.vtt"
+        export_srt(segments, srt_file)
+        export_vtt(segments, vtt_file)
+        assert "100:00:00,250 --> 100:00:01,500" in srt_file.read_text(encoding="utf-8")
+        assert "100:00:00.250 --> 100:00:01.500" in vtt_file.read_text(encoding="utf-8")
+
     def test_zero_duration_segment(self, temp_dir):
         """Test segment with zero duration (start == end)."""
         segments = [{"start": 1.0, "end": 1.0, "text": "Zero duration"}]
@@ -457,10 +591,18 @@ class TestEdgeCases:
         segments = [{"start": 0.0, "end": 1.0, "text": "No words", "speaker": "SPEAKER_00"}]
         output_file = temp_dir / "nowords.json"
         export_json(segments, output_file, include_words=True)
-        with open(output_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_file.read_bytes())
         assert "words" not in data["segments"][0]
 
+    def test_export_overwrites_longer_existing_file(self, temp_dir):
+        """Test re-exporting over a longer existing file truncates it."""
+        output_file = temp_dir / "rewrite.srt"
+        output_file.write_text("x" * 10_000, encoding="utf-8")
+        export_srt([{"start": 0.0, "end": 1.0, "text": "Short"}], output_file)
+        assert (
+            output_file.read_text(encoding="utf-8") == "1\n00:00:00,000 --> 00:00:01,000\nShort\n\n"
+        )
+
     def test_overlapping_segments(self, temp_dir):
         """Test export handles overlapping speech segments."""
         segments = [
@@ -0,0 +1,68 @@
+"""Unit tests for the multi-GPU load balancer."""
+
+import logging
+
+import pytest
+
+from pipeline.logger import TalkSmithLogger
+from pipeline.multigpu.load_balancer import LoadBalancer
+
+
+def _success(file, gpu_id=0):
+    return {
+        "type": "success",
+        "file": file,
+        "gpu_id": gpu_id,
+        "duration": 10.0,
+        "processing_time": 1.0,
+    }
+
+
+def _failure(file, error, gpu_id=1):
+    return {"type": "failure", "file": file, "gpu_id": gpu_id, "error": error}
+
+
+@pytest.fixture
+def balancer():
+    """LoadBalancer over GPUs 0 and 1 with a console-free logger."""
+    logger = TalkSmithLogger(name="test-load-balancer", console_output=False)
+    return LoadBalancer([0, 1], logger=logger)
+
+
+class TestLoadBalancerBatchLogging:
+    """Test per-file results reach the log on the multi-GPU path."""
+
+    def test_failure_logged_when_received(self, balancer, caplog):
+        """Test a failed file is logged at ERROR as soon as its result arrives."""
+        with caplog.at_level(logging.INFO, logger="test-load-balancer"):
+            balancer._process_result(_success("a.wav"))
+            balancer._process_result(_failure("b.wav", "CUDA error"))
+
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.ERROR, "Failed: b.wav")
+        ]
+
+    def test_print_summary_logs_batch_results(self, balancer, caplog, capsys):
+        """Test print_summary emits the buffered successes on the batch summary line."""
+        balancer._process_result(_success("a.wav"))
+        balancer._process_result(_success("c.wav", gpu_id=1))
+
+        with caplog.at_level(logging.INFO, logger="test-load-balancer"):
+            balancer.print_summary(total_files=2)
+
+        batch_record = next(r for r in caplog.records if "Batch complete" in r.getMessage())
+        assert batch_record.records == [
+            {"item": "a.wav", "status": "success"},
+            {"item": "c.wav", "status": "success"},
+        ]
+        assert "=== Summary ===" in capsys.readouterr().out
+
+    def test_reset_flushes_buffered_results(self, balancer, caplog):
+        """Test reset logs successes still buffered instead of discarding them."""
+        balancer._process_result(_success("a.wav"))
+
+        with caplog.at_level(logging.INFO, logger="test-load-balancer"):
+            balancer.reset()
+
+        assert [r.records for r in caplog.records] == [[{"item": "a.wav", "status": "success"}]]
+        assert balancer.batch_summary.total == 0
@@ -13,6 +13,7 @@ import pytest
 
 from pipeline.logger import (
     BatchLogSummary,
+    BufferedFileHandler,
     JSONFormatter,
     TalkSmithLogger,
     TransientError,
@@ -22,6 +23,14 @@ from pipeline.logger import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_logger_cache():
+    """Keep loggers built against patched config out of get_logger's cache."""
+    get_logger.cache_clear()
+    yield
+    get_logger.cache_clear()
+
+
 class TestJSONFormatter:
     """Test JSON formatter."""
 
@@ -97,6 +106,89 @@ class TestJSONFormatter:
         assert "Test error" in log_data["exception"]
 
 
+class TestBufferedFileHandler:
+    """Test BufferedFileHandler class."""
+
+    def _record(self, level, message):
+        return logging.LogRecord(
+            name="test",
+            level=level,
+            pathname="test.py",
+            lineno=1,
+            msg=message,
+            args=(),
+            exc_info=None,
+        )
+
+    def test_info_buffered_until_flush(self, temp_dir):
+        """Test records below ERROR stay buffered until flushed."""
+        log_file = temp_dir / "buffered.log"
+        handler = BufferedFileHandler(log_file)
+        try:
+            handler.emit(self._record(logging.INFO, "buffered message"))
+            assert log_file.read_text(encoding="utf-8") == ""
+
+            handler.flush()
+            assert log_file.read_text(encoding="utf-8") == "buffered message\n"
+        finally:
+            handler.close()
+
+    def test_error_flushed_immediately(self, temp_dir):
+        """Test ERROR records flush pending output straight away."""
+        log_file = temp_dir / "buffered.log"
+        handler = BufferedFileHandler(log_file)
+        try:
+            handler.emit(self._record(logging.INFO, "first"))
+            handler.emit(self._record(logging.ERROR, "failure"))
+            assert log_file.read_text(encoding="utf-8") == "first\nfailure\n"
+        finally:
+            handler.close()
+
+    def test_info_buffered_with_rotation_enabled(self, temp_dir):
+        """Test a size limit doesn't force a flush per record."""
+        log_file = temp_dir / "buffered.log"
+        handler = BufferedFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5)
+        try:
+            handler.emit(self._record(logging.INFO, "first"))
+            handler.emit(self._record(logging.INFO, "second"))
+            assert log_file.stat().st_size == 0
+
+            handler.emit(self._record(logging.ERROR, "failure"))
+            assert log_file.read_text(encoding="utf-8") == "first\nsecond\nfailure\n"
+
+            handler.emit(self._record(logging.INFO, "after"))
+            assert log_file.stat().st_size == len("first\nsecond\nfailure\n")
+
+            handler.flush()
+            assert log_file.read_text(encoding="utf-8").endswith("after\n")
+        finally:
+            handler.close()
+
+    def test_rotates_at_max_bytes(self, temp_dir):
+        """Test rollover still happens once the counted size reaches maxBytes."""
+        log_file = temp_dir / "buffered.log"
+        log_file.write_text("x" * 10, encoding="utf-8")
+        handler = BufferedFileHandler(log_file, maxBytes=20, backupCount=1)
+        try:
+            handler.emit(self._record(logging.INFO, "12345"))
+            handler.emit(self._record(logging.INFO, "rotated"))
+            handler.flush()
+
+            assert (temp_dir / "buffered.log.1").read_text(encoding="utf-8") == "x" * 10 + "12345\n"
+            assert log_file.read_text(encoding="utf-8") == "rotated\n"
+        finally:
+            handler.close()
+
+    def test_close_flushes(self, temp_dir):
+        """Test closing the handler writes buffered records."""
+        log_file = temp_dir / "buffered.log"
+        handler = BufferedFileHandler(log_file, delay=True)
+        handler.emit(self._record(logging.INFO, "on close"))
+        handler.close()
+
+        assert log_file.read_text(encoding="utf-8") == "on close\n"
+
+
 class TestTalkSmithLogger:
     """Test TalkSmithLogger class."""
 
@@ -228,6 +320,15 @@ class TestGetLogger:
         logger = get_logger("test", log_format="text")
         assert logger.log_format == "text"
 
+    def test_get_logger_cached(self):
+        """Test get_logger returns the same instance for the same arguments."""
+        assert get_logger("test-cached") is get_logger("test-cached")
+        assert get_logger("test-cached") is not get_logger("test-cached", log_format="text")
+
+        first = get_logger("test-cached")
+        get_logger.cache_clear()
+        assert get_logger("test-cached") is not first
+
 
 class TestBatchLogSummary:
     """Test BatchLogSummary class."""
@@ -292,6 +393,39 @@ class TestBatchLogSummary:
 
         assert "Batch complete" in caplog.text or "2/3 successful" in caplog.text
 
+    def test_records_buffered_until_summary(self, caplog):
+        """Test successes are emitted together by print_summary, failures immediately."""
+        logger = TalkSmithLogger(name="test")
+        summary = BatchLogSummary(logger)
+
+        with caplog.at_level(logging.DEBUG, logger="test"):
+            summary.record_success("file1.wav")
+            assert caplog.records == []
+
+            summary.record_failure("file2.wav", "Error")
+            assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+                (logging.ERROR, "Failed: file2.wav")
+            ]
+
+            summary.print_summary()
+
+        batch_record = next(r for r in caplog.records if "Batch complete" in r.getMessage())
+        assert batch_record.records == [{"item": "file1.wav", "status": "success"}]
+        assert summary.total == 2
+
+    def test_flush_logs_buffered_successes(self, caplog):
+        """Test flush emits buffered successes once and then has nothing left."""
+        logger = TalkSmithLogger(name="test")
+        summary = BatchLogSummary(logger)
+        summary.record_success("file1.wav")
+
+        with caplog.at_level(logging.INFO, logger="test"):
+            summary.flush()
+            summary.flush()
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].records == [{"item": "file1.wav", "status": "success"}]
+
     def test_empty_summary(self):
         """Test summary with no operations."""
         logger = TalkSmithLogger(name="test")
@@ -362,7 +496,7 @@ class TestRetryMechanism:
         assert result == "success"
         assert call_count["count"] == 1
 
-    def test_with_retry_decorator_transient_error(self):
+    def test_with_retry_decorator_transient_error(self, fake_clock):
         """Test retry decorator with transient errors."""
         logger = TalkSmithLogger(name="test")
         call_count = {"count": 0}
@@ -378,7 +512,7 @@ class TestRetryMechanism:
         assert result == "success"
         assert call_count["count"] == 3
 
-    def test_with_retry_decorator_permanent_failure(self):
+    def test_with_retry_decorator_permanent_failure(self, fake_clock):
         """Test retry decorator with permanent failure."""
         logger = TalkSmithLogger(name="test")
         call_count = {"count": 0}
@@ -409,7 +543,7 @@ class TestRetryMechanism:
         # Should fail immediately without retry
         assert call_count["count"] == 1
 
-    def test_with_retry_custom_exceptions(self):
+    def test_with_retry_custom_exceptions(self, fake_clock):
         """Test retry with custom exception types."""
         logger = TalkSmithLogger(name="test")
         call_count = {"count": 0}
@@ -433,7 +567,7 @@ class TestRetryMechanism:
         assert result == "success"
         assert call_count["count"] == 2
 
-    def test_retry_operation_function(self):
+    def test_retry_operation_function(self, fake_clock):
         """Test retry_operation function."""
         logger = TalkSmithLogger(name="test")
         call_count = {"count": 0}
@@ -449,7 +583,7 @@ class TestRetryMechanism:
         assert result == "success"
         assert call_count["count"] == 2
 
-    def test_retry_operation_with_lambda(self):
+    def test_retry_operation_with_lambda(self, fake_clock):
         """Test retry_operation with lambda."""
         logger = TalkSmithLogger(name="test")
         call_count = {"count": 0}
@@ -471,16 +605,14 @@ class TestRetryMechanism:
         assert result == 3
         assert call_count["count"] == 3
 
-    def test_retry_backoff_timing(self):
+    def test_retry_backoff_timing(self, fake_clock):
         """Test that backoff delays increase exponentially."""
-        import time
-
         logger = TalkSmithLogger(name="test")
         call_times = []
 
         @with_retry(max_attempts=3, initial_delay=0.1, backoff_factor=2.0, logger=logger)
         def operation():
-            call_times.append(time.time())
+            call_times.append(fake_clock.now())
             if len(call_times) < 3:
                 raise TransientError("Temporary failure")
             return "success"
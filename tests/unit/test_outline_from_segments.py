@@ -11,9 +11,9 @@ from pipeline.outline_from_segments import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_segments():
-    """Sample segments for outline generation."""
+    """Sample segments for outline generation, shared read-only across the module."""
     return [
         {
             "start": 0.0,
@@ -48,6 +48,12 @@ def sample_segments():
     ]
 
 
+@pytest.fixture(scope="module")
+def outline(sample_segments):
+    """Default 60 s interval outline of ``sample_segments``, generated once per module."""
+    return generate_outline(sample_segments, interval_seconds=60.0)
+
+
 @pytest.fixture
 def segments_with_topic_changes():
     """Segments with clear topic changes (long gaps)."""
@@ -207,10 +213,8 @@ class TestDetectTopicChange:
 class TestGenerateOutline:
     """Tests for generate_outline function."""
 
-    def test_generate_basic_outline(self, sample_segments):
+    def test_generate_basic_outline(self, outline):
         """Test basic outline generation."""
-        outline = generate_outline(sample_segments, interval_seconds=60.0)
-
         # Should have multiple entries based on time intervals
         assert len(outline) > 0
         assert all("timestamp" in entry for entry in outline)
@@ -218,10 +222,8 @@ class TestGenerateOutline:
         assert all("speaker" in entry for entry in outline)
         assert all("summary" in entry for entry in outline)
 
-    def test_outline_time_intervals(self, sample_segments):
+    def test_outline_time_intervals(self, outline):
         """Test that outline respects time intervals."""
-        outline = generate_outline(sample_segments, interval_seconds=60.0)
-
         # With 60s intervals and segments at 0, 10, 65, 76, 140 seconds
         # Should have entries around 0s, 65s, 140s
         assert len(outline) >= 2
@@ -254,10 +256,8 @@ class TestGenerateOutline:
         outline = generate_outline([])
         assert outline == []
 
-    def test_outline_timestamp_format(self, sample_segments):
+    def test_outline_timestamp_format(self, outline):
         """Test that timestamps are properly formatted."""
-        outline = generate_outline(sample_segments, interval_seconds=60.0)
-
         for entry in outline:
             ts = entry["timestamp_formatted"]
             assert ts.startswith("[")
@@ -274,10 +274,8 @@ class TestGenerateOutline:
             # Should be <= max_words (accounting for ellipsis)
             assert word_count <= 6  # 5 + possible ellipsis
 
-    def test_outline_preserves_speaker_info(self, sample_segments):
+    def test_outline_preserves_speaker_info(self, outline):
         """Test that speaker information is preserved."""
-        outline = generate_outline(sample_segments, interval_seconds=60.0)
-
         assert all("speaker" in entry for entry in outline)
         # First entry should be from Speaker 1
         assert outline[0]["speaker"] == "Speaker 1"
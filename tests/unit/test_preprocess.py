@@ -2,9 +2,6 @@
 Unit tests for audio preprocessing module.
 """
 
-import tempfile
-from pathlib import Path
-
 import numpy as np
 import pytest
 import soundfile as sf
@@ -79,7 +76,7 @@ class TestAudioPreprocessor:
         target_peak = 10 ** (-3.0 / 20.0)  # -3 dBFS
         assert np.isclose(peak, target_peak, rtol=0.01)
 
-    def test_trim_silence(self):
+    def test_trim_silence(self, tmp_path):
         """Test silence trimming."""
         # Create audio with silence at start and end
         sample_rate = 16000
@@ -93,23 +90,19 @@ class TestAudioPreprocessor:
         audio[start_idx:end_idx] = np.random.randn(end_idx - start_idx) * 0.1
 
         # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = Path(f.name)
-            sf.write(temp_path, audio, sample_rate)
+        temp_path = tmp_path / "input.wav"
+        sf.write(temp_path, audio, sample_rate)
 
-        try:
-            preprocessor = AudioPreprocessor(trim_silence=True, silence_threshold_db=-40.0)
-            output_path, metrics = preprocessor.process(temp_path)
+        preprocessor = AudioPreprocessor(trim_silence=True, silence_threshold_db=-40.0)
+        output_path, metrics = preprocessor.process(temp_path)
 
-            assert "trim_silence" in metrics["steps_applied"]
-            assert "silence_trimmed_seconds" in metrics
-            assert metrics["silence_trimmed_seconds"] > 0
+        assert "trim_silence" in metrics["steps_applied"]
+        assert "silence_trimmed_seconds" in metrics
+        assert metrics["silence_trimmed_seconds"] > 0
 
-            # Verify trimmed audio is shorter
-            trimmed_audio, _ = sf.read(output_path)
-            assert len(trimmed_audio) < len(audio)
-        finally:
-            temp_path.unlink()
+        # Verify trimmed audio is shorter
+        trimmed_audio, _ = sf.read(output_path)
+        assert len(trimmed_audio) < len(audio)
 
     def test_high_pass_filter(self, sample_audio_path):
         """Test high-pass filter."""
@@ -151,25 +144,21 @@ class TestAudioPreprocessor:
         assert "loudness_normalization" in metrics["steps_applied"]
         assert output_path.exists()
 
-    def test_empty_audio_handling(self):
+    def test_empty_audio_handling(self, tmp_path):
         """Test handling of empty/silent audio."""
         # Create silent audio
         sample_rate = 16000
         duration = 1.0
         audio = np.zeros(int(duration * sample_rate))
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = Path(f.name)
-            sf.write(temp_path, audio, sample_rate)
+        temp_path = tmp_path / "input.wav"
+        sf.write(temp_path, audio, sample_rate)
 
-        try:
-            preprocessor = AudioPreprocessor(trim_silence=True)
-            output_path, metrics = preprocessor.process(temp_path)
+        preprocessor = AudioPreprocessor(trim_silence=True)
+        output_path, metrics = preprocessor.process(temp_path)
 
-            # Should handle gracefully
-            assert output_path.exists()
-        finally:
-            temp_path.unlink()
+        # Should handle gracefully
+        assert output_path.exists()
 
 
 @pytest.mark.unit
@@ -212,7 +201,7 @@ class TestPreprocessAudioFunction:
 class TestLoudnessNormalization:
     """Tests for loudness normalization."""
 
-    def test_normalize_quiet_audio(self):
+    def test_normalize_quiet_audio(self, tmp_path):
         """Test normalizing quiet audio."""
         sample_rate = 16000
         duration = 1.0
@@ -220,21 +209,17 @@ class TestLoudnessNormalization:
         # Create quiet audio
         audio = np.random.randn(int(duration * sample_rate)) * 0.01
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = Path(f.name)
-            sf.write(temp_path, audio, sample_rate)
+        temp_path = tmp_path / "input.wav"
+        sf.write(temp_path, audio, sample_rate)
 
-        try:
-            preprocessor = AudioPreprocessor(loudnorm=True)
-            output_path, _ = preprocessor.process(temp_path)
+        preprocessor = AudioPreprocessor(loudnorm=True)
+        output_path, _ = preprocessor.process(temp_path)
 
-            # Verify audio was amplified
-            normalized_audio, _ = sf.read(output_path)
-            assert np.abs(normalized_audio).max() > np.abs(audio).max()
-        finally:
-            temp_path.unlink()
+        # Verify audio was amplified
+        normalized_audio, _ = sf.read(output_path)
+        assert np.abs(normalized_audio).max() > np.abs(audio).max()
 
-    def test_normalize_loud_audio(self):
+    def test_normalize_loud_audio(self, tmp_path):
         """Test normalizing loud audio."""
         sample_rate = 16000
         duration = 1.0
@@ -242,19 +227,15 @@ class TestLoudnessNormalization:
         # Create loud audio
         audio = np.random.randn(int(duration * sample_rate)) * 0.9
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = Path(f.name)
-            sf.write(temp_path, audio, sample_rate)
+        temp_path = tmp_path / "input.wav"
+        sf.write(temp_path, audio, sample_rate)
 
-        try:
-            preprocessor = AudioPreprocessor(loudnorm=True)
-            output_path, _ = preprocessor.process(temp_path)
-
-            # Verify audio was attenuated
-            normalized_audio, _ = sf.read(output_path)
-            assert np.abs(normalized_audio).max() < np.abs(audio).max()
-        finally:
-            temp_path.unlink()
+        preprocessor = AudioPreprocessor(loudnorm=True)
+        output_path, _ = preprocessor.process(temp_path)
+
+        # Verify audio was attenuated
+        normalized_audio, _ = sf.read(output_path)
+        assert np.abs(normalized_audio).max() < np.abs(audio).max()
 
 
 @pytest.mark.unit